@@ -14,11 +14,12 @@ import os
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-print("🚀 AUTARK SPECIALIZED CODING AGENTS - SYSTEM COMPLETE")
-print("=" * 70)
-
-print("\n📋 SYSTEM OVERVIEW:")
-print("""
+# Gesamte Ausgabe als ein String, wird mit einem einzigen write() ausgegeben
+_BANNER = "\n".join([
+    "🚀 AUTARK SPECIALIZED CODING AGENTS - SYSTEM COMPLETE",
+    "=" * 70,
+    "\n📋 SYSTEM OVERVIEW:",
+    """
 The AUTARK system has been successfully extended with specialized 
 coding agents that integrate advanced AI-driven development approaches:
 
@@ -27,12 +28,10 @@ coding agents that integrate advanced AI-driven development approaches:
 🧠 RAG CODING      - Kontextbewusste Entwicklung mit Wissensabruf
 ⚡ ASYNC CODING    - Hochperformante parallele Entwicklung
 ⭐ SPECIAL CODING  - Domain-spezifische Expertensysteme
-""")
-
-print("\n🔧 IMPLEMENTED COMPONENTS:")
-print("""
+""",
+    "\n🔧 IMPLEMENTED COMPONENTS:",
+    """
 1. CORE AGENTS (/agents/specialized_coding_agents.py)
-   ✅ BloomFilter - Effizienter Duplicate-Check
    ✅ SimpleVectorStore - RAG Vector Database
    ✅ LazyCodeAgent - Lazy Evaluation Patterns
    ✅ VibingCodeAgent - Flow State Optimization
@@ -69,10 +68,9 @@ print("""
    ✅ Integration Testing - System-wide verification
    ✅ Performance Testing - Metrics collection
    ✅ Feature Demonstration - Complete functionality
-""")
-
-print("\n🎯 CODING MODES CAPABILITIES:")
-print("""
+""",
+    "\n🎯 CODING MODES CAPABILITIES:",
+    """
 🦥 LAZY CODING:
    • Automatische Code-Optimierung
    • Generator-basierte Lazy Evaluation
@@ -102,48 +100,43 @@ print("""
    • Specialized Pattern Recognition  
    • Expert Knowledge Integration
    • Custom Domain Optimizations
-""")
-
-print("\n🗂️ DATABASE INTEGRATION:")
-print("""
+""",
+    "\n🗂️ DATABASE INTEGRATION:",
+    """
 ✅ PostgreSQL (Port 5433) - Relational data storage
 ✅ Redis (Port 6380) - Caching and session management
 ✅ Qdrant (Port 6334) - Vector database for RAG
 ✅ MongoDB (Port 27018) - Document storage
 ✅ Elasticsearch (Port 9201) - Search and analytics
-""")
-
-print("\n🌐 DEPLOYMENT INTERFACES:")
-print("""
+""",
+    "\n🌐 DEPLOYMENT INTERFACES:",
+    """
 ✅ Original Overlay Dashboard: http://localhost:8888
 ✅ Specialized Dashboard: python overlay/specialized_dashboard.py
 ✅ CLI Interface: python autark_specialized.py [command]
 ✅ Direct Integration: from agents.autark_coding_integration import *
-""")
-
-print("\n📊 PERFORMANCE FEATURES:")
-print("""
+""",
+    "\n📊 PERFORMANCE FEATURES:",
+    """
 ✅ Session Management - Track multiple concurrent agents
 ✅ Mode Usage Statistics - Analyze coding pattern preferences
 ✅ Duration Tracking - Monitor performance metrics
 ✅ Auto-scaling - Dynamic resource allocation
 ✅ Error Handling - Robust failure recovery
-""")
-
-print("\n🔗 EXTERNAL INTEGRATIONS:")
-print("""
+""",
+    "\n🔗 EXTERNAL INTEGRATIONS:",
+    """
 ✅ Abacus AI CodeLLM CLI - Direct execution integration
 ✅ sentence-transformers - AI-powered semantic search
 ✅ aiohttp - Async web framework for dashboard
 ✅ Docker Compose - Container orchestration ready
 ✅ Original AUTARK System - Seamless integration
-""")
-
-print("\n💡 USAGE EXAMPLES:")
-print("""
+""",
+    "\n💡 USAGE EXAMPLES:",
+    """
 # CLI Usage
 python autark_specialized.py create lazy "Optimize database queries"
-python autark_specialized.py status lazy_20250826_123456
+python autark_specialized.py status lazy_1
 python autark_specialized.py list
 
 # Python Integration
@@ -154,11 +147,10 @@ status = await specialized_agent_manager.get_agent_status(session_id)
 # Dashboard Access
 # Start: python overlay/specialized_dashboard.py
 # Visit: http://localhost:8889/specialized/dashboard
-""")
-
-print("\n🎉 SYSTEM STATUS: FULLY OPERATIONAL")
-print("=" * 70)
-print("""
+""",
+    "\n🎉 SYSTEM STATUS: FULLY OPERATIONAL",
+    "=" * 70,
+    """
 ✅ All 5 specialized coding modes implemented
 ✅ Complete integration with AUTARK infrastructure  
 ✅ Web dashboard and CLI interfaces available
@@ -175,10 +167,9 @@ Next Steps:
 2. Launch Specialized Dashboard: python overlay/specialized_dashboard.py  
 3. Test via CLI: python autark_specialized.py create auto "Your coding task"
 4. Integrate into your development workflow
-""")
-
-print("\n🔧 Technical Architecture:")
-print("""
+""",
+    "\n🔧 Technical Architecture:",
+    """
 ┌─────────────────────────────────────────────────────────────┐
 │                    AUTARK SPECIALIZED AGENTS                │
 ├─────────────────────────────────────────────────────────────┤
@@ -213,8 +204,12 @@ print("""
 │         │ PostgreSQL│Redis│...│                          │
 │         └─────────────────────┘                          │
 └─────────────────────────────────────────────────────────────┘
-""")
+""",
+    "\n🎯 System is ready for advanced AI-driven coding!",
+    "Documentation and examples available in all component files."
+
+]) + "\n"
+
 
 if __name__ == "__main__":
-    print("\n🎯 System is ready for advanced AI-driven coding!")
-    print("Documentation and examples available in all component files.")
\ No newline at end of file
+    sys.stdout.write(_BANNER)
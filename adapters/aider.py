@@ -1,4 +1,4 @@
-import subprocess, json, tempfile, os
+import subprocess, json
 
 class AiderAdapter:
     def __init__(self, binary="aider"):
@@ -7,10 +7,12 @@ class AiderAdapter:
     def propose(self, goal, files):
         # Provide goal + restricted file list to Aider
         prompt = f"Task: {goal}\nFocus on files: {', '.join(files)}"
-        with tempfile.NamedTemporaryFile("w", delete=False) as f:
-            f.write(prompt)
-            path = f.name
-        # Example run - in practice you'd use Aider chat mode with --message
-        cmd = [self.binary, "--message-file", path] + files
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=900)
-        return {"stdout": proc.stdout, "stderr": proc.stderr, "rc": proc.returncode}
\ No newline at end of file
+        # Pass the prompt inline via --message (no temp file on disk)
+        cmd = [self.binary, "--message", prompt] + files
+        # Capture raw bytes and decode once as UTF-8 instead of via the locale codec
+        proc = subprocess.run(cmd, capture_output=True, timeout=900)
+        return {
+            "stdout": proc.stdout.decode("utf-8", "replace"),
+            "stderr": proc.stderr.decode("utf-8", "replace"),
+            "rc": proc.returncode,
+        }
\ No newline at end of file
@@ -6,7 +6,14 @@ Erweitert die bestehende agent_factory.py um neue Coding-Modi
 
 import asyncio
 import hashlib
-from typing import Dict, Any, List
+import itertools
+import re
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
 from .specialized_coding_agents import (
     SpecializedCodingOrchestrator,
@@ -14,20 +21,201 @@ from .specialized_coding_agents import (
 )
 import logging
 
+# dataclass(slots=True) gibt es erst ab Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 logger = logging.getLogger(__name__)
 
 
+def _base36(number: int) -> str:
+    """Nicht-negative Ganzzahl als kurzer Base36-String"""
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    encoded = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        encoded = digits[remainder] + encoded
+        if not number:
+            return encoded
+
+
+def _task_id(task: str) -> str:
+    """Kurze Task-ID (8 Hex-Zeichen) aus dem Task-Text, unabhängig von der Umgebung stabil"""
+    # SHA-256 nutzt in OpenSSL die SHA-NI Instruktionen, wenn verfügbar
+    return hashlib.sha256(task.encode()).digest()[:4].hex()
+
+
+# Keyword-Tabellen für Domain-, Komplexitäts- und Modus-Erkennung.
+# Die Reihenfolge bestimmt jeweils die Priorität.
+_DOMAIN_KEYWORDS = {
+    "database": frozenset({"database", "sql", "query", "table", "index"}),
+    "web": frozenset({"ui", "interface", "frontend", "html", "css", "react"}),
+    "api": frozenset({"api", "request", "endpoint", "rest", "microservice"}),
+    "data": frozenset({"data", "analysis", "processing", "pipeline", "etl"}),
+    "ml": frozenset({"machine learning", "model", "training", "prediction"}),
+    "devops": frozenset({"deployment", "docker", "kubernetes", "ci/cd", "pipeline"})
+}
+
+_COMPLEXITY_KEYWORDS = {
+    "high": frozenset({"complex", "advanced", "thousands", "optimize"}),
+    "medium": frozenset({"multiple", "various", "several"})
+}
+
+_MODE_KEYWORDS = {
+    # Lazy mode für Optimierungen
+    "lazy": frozenset({"optimize", "improve", "refactor", "clean"}),
+    # Vibing mode für kreative UI/UX Arbeit
+    "vibing": frozenset({"beautiful", "creative", "design", "ui", "ux"}),
+    # RAG mode für dokumentationsbezogene Aufgaben
+    "rag": frozenset({"documentation", "context", "knowledge", "research"}),
+    # Async mode für Performance und Concurrency
+    "async": frozenset({"concurrent", "parallel", "thousands", "performance"}),
+    # Special mode für ML/AI/spezielle Domains
+    "special": frozenset({"machine learning", "ai", "model", "algorithm"})
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Ab dieser Task-Länge (Zeichen) läuft die Analyse in einem Worker-Thread,
+# damit große Eingaben (z.B. Code-Dumps) den Event-Loop nicht blockieren
+_INLINE_ANALYSIS_LIMIT = 64 * 1024
+
+# Nur Sessions in diesen Zuständen dürfen aus active_sessions verdrängt werden
+_TERMINAL_STATUSES = frozenset(("completed", "error"))
+
+
+def _build_keyword_tables():
+    """Ordnet jedem Keyword-Tag ein Bit zu und trennt Einzelwörter von Phrasen
+    
+    Keywords, die kein einzelnes Token sind ("machine learning", "ci/cd"),
+    werden weiterhin per Substring-Test gesucht.
+    """
+    bits = {}
+    word_masks = {}
+    phrase_masks = {}
+    for category, table in (("domain", _DOMAIN_KEYWORDS),
+                            ("complexity", _COMPLEXITY_KEYWORDS),
+                            ("mode", _MODE_KEYWORDS)):
+        for name, words in table.items():
+            bit = 1 << len(bits)
+            bits[(category, name)] = bit
+            for word in words:
+                target = word_masks if _TOKEN_RE.fullmatch(word) else phrase_masks
+                target[word] = target.get(word, 0) | bit
+    return bits, word_masks, frozenset(word_masks), tuple(phrase_masks.items())
+
+
+_KEYWORD_BITS, _WORD_MASKS, _KEYWORDS, _PHRASE_MASKS = _build_keyword_tables()
+
+
+def _build_mode_table():
+    """Lookup-Tabelle Modus-Bitmaske -> Modus unter Beachtung der Priorität
+    
+    Die Modus-Bits liegen zusammenhängend in der Keyword-Maske; Index ist
+    (mask >> shift) & field, Eintrag der höchstpriorisierte gesetzte Modus.
+    """
+    modes = list(_MODE_KEYWORDS)
+    shift = _KEYWORD_BITS[("mode", modes[0])].bit_length() - 1
+    table = []
+    for sub_mask in range(1 << len(modes)):
+        table.append(next(
+            (mode for i, mode in enumerate(modes) if sub_mask >> i & 1),
+            "lazy"  # Default fallback
+        ))
+    return shift, (1 << len(modes)) - 1, tuple(table)
+
+
+_MODE_SHIFT, _MODE_FIELD, _MODE_BY_MASK = _build_mode_table()
+
+
+def _keyword_mask(task_lower: str) -> int:
+    """Tokenisiert den Task einmal und liefert die Bitmaske aller Keyword-Tags"""
+    mask = 0
+    for word in _KEYWORDS.intersection(_TOKEN_RE.findall(task_lower)):
+        mask |= _WORD_MASKS[word]
+    for phrase, bit in _PHRASE_MASKS:
+        if phrase in task_lower:
+            mask |= bit
+    return mask
+
+
+def _first_match(mask: int, category: str, table: Dict[str, FrozenSet[str]], default: str) -> str:
+    """Erster Eintrag einer Tabelle, dessen Tag-Bit in der Maske gesetzt ist"""
+    for name in table:
+        if mask & _KEYWORD_BITS[(category, name)]:
+            return name
+    return default
+
+
+@lru_cache(maxsize=2048)
+def _analyze_task(task: str) -> Tuple[str, str, str, Tuple[str, ...], str]:
+    """Deterministischer Teil der Kontextanalyse: (task_id, domain, complexity, keywords, mode)"""
+    task_lower = task.lower()
+    
+    # Simple keyword-based domain detection
+    mask = _keyword_mask(task_lower)
+    domain = _first_match(mask, "domain", _DOMAIN_KEYWORDS, "general")
+    
+    # Estimate complexity
+    complexity = _first_match(mask, "complexity", _COMPLEXITY_KEYWORDS, "low")
+    
+    # Modus für "auto" aus derselben Maske
+    mode = _MODE_BY_MASK[(mask >> _MODE_SHIFT) & _MODE_FIELD]
+    
+    return _task_id(task), domain, complexity, tuple(task_lower.split()[:5]), mode
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Session:
+    """Zustand einer spezialisierten Coding-Session"""
+    mode: str
+    task: str
+    priority: int
+    context: CodingContext
+    created_at: str
+    created_monotonic: float
+    status: str = "active"
+    result: Any = None
+    error: Optional[str] = None
+
+
 class AutarkCodingAgentFactory:
     """
     Enhanced Agent Factory mit spezialisierten Coding-Modi
     Integriert in das bestehende AUTARK SYSTEM
     """
     
-    def __init__(self, database_manager=None):
+    def __init__(
+        self,
+        database_manager=None,
+        max_concurrent_agents: int = 10,
+        max_sessions: int = 1000
+    ):
         self.database_manager = database_manager
         self.orchestrator = SpecializedCodingOrchestrator()
-        self.active_sessions = {}
-        self.session_counter = 0
+        # LRU-begrenzt: älteste Sessions werden verdrängt (Historie in der DB)
+        self.active_sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.max_sessions = max_sessions
+        # Monotoner Zähler für kollisionsfreie Session-IDs
+        self._next_id = itertools.count(1)
+        # Laufende Aggregate abgeschlossener Sessions (O(1) Metriken)
+        self.completed_duration_sum = 0.0
+        self.completed_count = 0
+        # Backpressure: begrenzt gleichzeitig laufende Agent-Tasks. Die Semaphore
+        # entsteht erst in der laufenden Loop (bis 3.9 bindet sie sich beim Anlegen
+        # an get_event_loop(), beim Modul-Import wäre das die falsche Loop)
+        self.max_concurrent_agents = max_concurrent_agents
+        self._task_sem: Optional[asyncio.Semaphore] = None
+        self._task_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Laufende Agent-Tasks (die Event-Loop hält nur schwache Referenzen)
+        self._agent_tasks: Set[asyncio.Task] = set()
+        
+    def _task_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore der laufenden Event-Loop (bei Loop-Wechsel neu angelegt)"""
+        loop = asyncio.get_running_loop()
+        if self._task_sem is None or self._task_sem_loop is not loop:
+            self._task_sem = asyncio.Semaphore(self.max_concurrent_agents)
+            self._task_sem_loop = loop
+        return self._task_sem
         
     async def initialize(self):
         """Initialisierung der Factory"""
@@ -37,45 +225,96 @@ class AutarkCodingAgentFactory:
     async def create_specialized_agent(self, mode: str, task: str, priority: int = 1):
         """Erstellt einen spezialisierten Coding-Agenten"""
         
-        # Detect coding context 
-        context = self._analyze_coding_context(task)
-        
-        # Auto-mode detection
-        if mode == "auto":
-            mode = self._detect_optimal_mode(task, context)
+        # Detect coding context + auto-mode detection
+        if len(task) > _INLINE_ANALYSIS_LIMIT:
+            context, mode = await asyncio.get_running_loop().run_in_executor(
+                None, self._classify_task, task, mode
+            )
+        else:
+            context, mode = self._classify_task(task, mode)
             
-        # Generate session ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        session_id = f"{mode}_{timestamp}"
-        
-        # Create agent session
-        self.active_sessions[session_id] = {
-            "mode": mode,
-            "task": task,
-            "priority": priority,
-            "context": context,
-            "created_at": datetime.now().isoformat(),
-            "status": "active"
-        }
+        # Generate session ID (Zeitstempel steht in created_at)
+        session_id = f"{mode}_{_base36(next(self._next_id))}"
+        
+        # Create agent session (Wartezeit auf einen freien Slot zählt zur Dauer)
+        session = Session(
+            mode=mode,
+            task=task,
+            priority=priority,
+            context=context,
+            created_at=datetime.now().isoformat(),
+            created_monotonic=time.monotonic()
+        )
         
-        # Start processing
-        asyncio.create_task(self._process_agent_task(session_id, mode, task, context))
+        # Wartet, solange das System ausgelastet ist; erst danach wird die Session
+        # eingetragen, damit ein hier abgebrochener Aufruf keine Session hinterlässt
+        task_sem = self._task_semaphore()
+        await task_sem.acquire()
+        self.active_sessions[session_id] = session
+        self._evict_sessions()
+        
+        # Start processing; Referenz halten, bis der Task fertig ist
+        agent_task = asyncio.create_task(self._process_agent_task(session_id, session, task_sem))
+        self._agent_tasks.add(agent_task)
+        agent_task.add_done_callback(self._agent_tasks.discard)
         
         return session_id
     
-    async def _process_agent_task(self, session_id: str, mode: str, task: str, context: CodingContext):
+    async def _process_agent_task(self, session_id: str, session: Session,
+                                  task_sem: asyncio.Semaphore):
         """Verarbeitet eine Agent-Aufgabe"""
         try:
-            result = await self.orchestrator.process_request(mode, task, context)
+            result = await self.orchestrator.process_request(
+                session.mode, session.task, session.context
+            )
             
             # Update session
-            self.active_sessions[session_id]["result"] = result
-            self.active_sessions[session_id]["status"] = "completed"
+            session.result = result
+            session.status = "completed"
             
         except Exception as e:
             logger.error(f"Error processing agent task {session_id}: {e}")
-            self.active_sessions[session_id]["error"] = str(e)
-            self.active_sessions[session_id]["status"] = "error"
+            session.error = str(e)
+            session.status = "error"
+        
+        finally:
+            task_sem.release()
+        
+        self._record_duration(session)
+        # Aufgeschobene Verdrängung nachholen, falls zuvor nur laufende Sessions da waren
+        self._evict_sessions()
+    
+    def _evict_sessions(self):
+        """Älteste beendete Sessions verdrängen, bis max_sessions eingehalten ist
+        
+        Wartende und laufende Sessions bleiben erhalten; solange nur sie
+        übrig sind, darf die Grenze vorübergehend überschritten werden.
+        """
+        excess = len(self.active_sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        evicted = []
+        for session_id, session in self.active_sessions.items():
+            if session.status in _TERMINAL_STATUSES:
+                evicted.append(session_id)
+                if len(evicted) == excess:
+                    break
+        for session_id in evicted:
+            del self.active_sessions[session_id]
+    
+    def _record_duration(self, session: Session):
+        """Dauer einer beendeten Session in die laufenden Aggregate übernehmen"""
+        self.completed_duration_sum += time.monotonic() - session.created_monotonic
+        self.completed_count += 1
+    
+    def _classify_task(self, task: str, mode: str) -> Tuple[CodingContext, str]:
+        """Kontextanalyse und ggf. automatische Modus-Erkennung (CPU-gebunden)"""
+        context = self._analyze_coding_context(task)
+        
+        if mode == "auto":
+            mode = self._detect_optimal_mode(task, context)
+        
+        return context, mode
     
     def _analyze_coding_context(
         self, 
@@ -83,85 +322,45 @@ class AutarkCodingAgentFactory:
     ) -> CodingContext:
         """Analysiert den Coding-Kontext"""
         
-        # Simple keyword-based domain detection
-        keywords = {
-            "database": ["database", "sql", "query", "table", "index"],
-            "web": ["ui", "interface", "frontend", "html", "css", "react"],
-            "api": ["api", "request", "endpoint", "rest", "microservice"],
-            "data": ["data", "analysis", "processing", "pipeline", "etl"],
-            "ml": ["machine learning", "model", "training", "prediction"],
-            "devops": ["deployment", "docker", "kubernetes", "ci/cd", "pipeline"]
-        }
-        
-        domain = "general"
-        for domain_name, words in keywords.items():
-            if any(word in task.lower() for word in words):
-                domain = domain_name
-                break
-        
-        # Estimate complexity
-        complexity = "low"
-        if any(word in task.lower() for word in ["complex", "advanced", "thousands", "optimize"]):
-            complexity = "high"
-        elif any(word in task.lower() for word in ["multiple", "various", "several"]):
-            complexity = "medium"
+        # Wiederholte Tasks werden aus dem Cache bedient
+        task_id, domain, complexity, keywords, _ = _analyze_task(task)
         
         return CodingContext(
             mode="analysis",
-            task_id=hashlib.md5(task.encode()).hexdigest()[:8],
+            task_id=task_id,
             priority=1,
             estimated_complexity=complexity,
             domain=domain,
             start_time=datetime.now(),
-            metadata={"keywords": task.lower().split()[:5]}
+            metadata={"keywords": list(keywords)}
         )
     
     def _detect_optimal_mode(self, task: str, context: CodingContext) -> str:
-        """Automatische Modus-Erkennung"""
-        
-        task_lower = task.lower()
-        
-        # Lazy mode für Optimierungen
-        if any(word in task_lower for word in ["optimize", "improve", "refactor", "clean"]):
-            return "lazy"
-        
-        # Vibing mode für kreative UI/UX Arbeit
-        if any(word in task_lower for word in ["beautiful", "creative", "design", "ui", "ux"]):
-            return "vibing"
-        
-        # RAG mode für dokumentationsbezogene Aufgaben
-        if any(word in task_lower for word in ["documentation", "context", "knowledge", "research"]):
-            return "rag"
-        
-        # Async mode für Performance und Concurrency
-        if any(word in task_lower for word in ["concurrent", "parallel", "thousands", "performance"]):
-            return "async"
-        
-        # Special mode für ML/AI/spezielle Domains
-        if any(word in task_lower for word in ["machine learning", "ai", "model", "algorithm"]):
-            return "special"
-        
-        # Default fallback
-        return "lazy"
+        """Automatische Modus-Erkennung (aus dem Cache der Kontextanalyse)"""
+        return _analyze_task(task)[4]
     
     async def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """Status einer Session abrufen"""
         if session_id not in self.active_sessions:
             return {"error": f"Session {session_id} not found"}
         
-        session = self.active_sessions[session_id]
-        duration = (datetime.now() - datetime.fromisoformat(session["created_at"])).total_seconds()
+        self.active_sessions.move_to_end(session_id)
+        return self._session_status_sync(session_id, self.active_sessions[session_id])
+    
+    def _session_status_sync(self, session_id: str, session: Session) -> Dict[str, Any]:
+        """Status-Dict einer Session (synchron, ohne Lookup)"""
+        duration = time.monotonic() - session.created_monotonic
         
         return {
             "session_id": session_id,
-            "mode": session["mode"],
-            "task": session["task"],
-            "status": session["status"],
-            "context": session["context"],
+            "mode": session.mode,
+            "task": session.task,
+            "status": session.status,
+            "context": session.context,
             "duration_seconds": duration,
-            "created_at": session["created_at"],
-            "result": session.get("result"),
-            "error": session.get("error"),
+            "created_at": session.created_at,
+            "result": session.result,
+            "error": session.error,
             "integrations": {
                 "database_connected": self.database_manager is not None,
                 "codellm_available": True  # Simulation
@@ -174,8 +373,8 @@ class AutarkCodingAgentFactory:
             return {"error": f"Session {session_id} not found"}
         
         session = self.active_sessions[session_id]
-        mode = session["mode"]
-        context = session["context"]
+        mode = session.mode
+        context = session.context
         
         # Process additional request
         result = await self.orchestrator.process_request(mode, additional_request, context)
@@ -232,34 +431,36 @@ class AutarkSpecializedAgentManager:
     
     async def list_active_agents(self):
         """Liste alle aktiven Agenten"""
-        active_agents = []
-        
-        for session_id, agent_info in self.agent_factory.active_sessions.items():
-            try:
-                status = await self.get_agent_status(session_id)
-                if "error" not in status:
-                    active_agents.append({
-                        "session_id": session_id,
-                        "mode": status.get("mode", "unknown"),
-                        "status": status,
-                        "created_at": agent_info.get("created_at", "unknown")
-                    })
-            except Exception as e:
-                logger.warning(f"Error getting status for {session_id}: {e}")
-        
-        return active_agents
+        factory = self.agent_factory
+        
+        # Ein synchroner Durchlauf statt eines await pro Session
+        return [
+            {
+                "session_id": session_id,
+                "mode": session.mode,
+                "status": factory._session_status_sync(session_id, session),
+                "created_at": session.created_at
+            }
+            for session_id, session in factory.active_sessions.items()
+        ]
     
-    def get_performance_metrics(self) -> Dict[str, Any]:
-        """Performance-Metriken abrufen"""
-        if self.agent_factory.active_sessions:
-            durations = []
-            for session in self.agent_factory.active_sessions.values():
-                if "created_at" in session:
-                    duration = (datetime.now() - datetime.fromisoformat(session["created_at"])).total_seconds()
-                    durations.append(duration)
-            
-            if durations:
-                self.metrics["average_duration"] = sum(durations) / len(durations)
+    def get_performance_metrics(self, include_active: bool = False) -> Dict[str, Any]:
+        """Performance-Metriken abrufen
+        
+        Die durchschnittliche Dauer stammt aus den laufenden Aggregaten
+        abgeschlossener Sessions. Mit include_active=True werden zusätzlich
+        alle noch gespeicherten Sessions einmal durchlaufen.
+        """
+        factory = self.agent_factory
+        self.metrics["average_duration"] = (
+            factory.completed_duration_sum / max(1, factory.completed_count)
+        )
+        
+        if include_active and factory.active_sessions:
+            now = time.monotonic()
+            durations = [now - session.created_monotonic
+                         for session in factory.active_sessions.values()]
+            self.metrics["active_average_duration"] = sum(durations) / len(durations)
         
         return self.metrics
 
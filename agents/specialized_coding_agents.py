@@ -6,25 +6,126 @@ Erweitert das AUTARK SYSTEM um specialized coding patterns
 
 import asyncio
 import aiohttp
+import io
 import numpy as np
-from typing import List, Dict, Any, Optional, Generator
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 import json
-import hashlib
-from functools import lru_cache
+from collections import Counter, OrderedDict
+from functools import lru_cache, partial
 import mmh3
-import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
 from sentence_transformers import SentenceTransformer
 import logging
 
+# dataclass(slots=True) gibt es erst ab Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+ONNX_CACHE_DIR = Path(os.environ.get(
+    "AUTARK_ONNX_CACHE", Path.home() / ".cache" / "autark" / "all-MiniLM-L6-v2-onnx-int8"
+))
+
+# Schutz gegen Division durch Null bei leeren/degenerierten Embeddings
+_NORM_EPS = 1e-12
+
+
+def _l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-Normalisierung entlang der letzten Achse (in-place, float32)"""
+    embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True) + _NORM_EPS
+    return embeddings
+
+
+class OnnxSentenceEncoder:
+    """int8-quantisierter MiniLM-Encoder auf ONNX Runtime
+    
+    Bietet die von SimpleVectorStore genutzte Teilmenge der
+    SentenceTransformer.encode API (Mean-Pooling, optionale L2-Normalisierung).
+    """
+    
+    def __init__(self, model, tokenizer):
+        self.model = model
+        self.tokenizer = tokenizer
+    
+    def encode(self, texts: List[str], batch_size: int = 32,
+               normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True, truncation=True, return_tensors="np"
+            )
+            hidden = self.model(**tokens).last_hidden_state
+            mask = tokens["attention_mask"][..., None].astype(np.float32)
+            batches.append((hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        
+        embeddings = np.concatenate(batches).astype(np.float32)
+        if normalize_embeddings:
+            _l2_normalize(embeddings)
+        return embeddings
+    
+    @classmethod
+    def load(cls, cache_dir: Path = ONNX_CACHE_DIR) -> "OnnxSentenceEncoder":
+        """Lädt das quantisierte Modell; exportiert und quantisiert beim ersten Aufruf"""
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+        
+        if not (cache_dir / "model_quantized.onnx").exists():
+            logger.info(f"Exporting int8 ONNX encoder to {cache_dir}")
+            fp32_model = ORTModelForFeatureExtraction.from_pretrained(EMBEDDING_MODEL, export=True)
+            quantizer = ORTQuantizer.from_pretrained(fp32_model)
+            quantizer.quantize(
+                save_dir=cache_dir,
+                quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            )
+            AutoTokenizer.from_pretrained(EMBEDDING_MODEL).save_pretrained(cache_dir)
+        
+        model = ORTModelForFeatureExtraction.from_pretrained(
+            cache_dir, file_name="model_quantized.onnx", provider="CPUExecutionProvider"
+        )
+        return cls(model, AutoTokenizer.from_pretrained(cache_dir))
+
+
+def _cuda_available() -> bool:
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Gemeinsamer Embedding-Encoder für alle Agenten (wird nur einmal geladen)
+    
+    Mit CUDA läuft SentenceTransformer in FP16 auf der GPU; sonst wird der
+    quantisierte ONNX-Encoder bevorzugt und ohne optimum/onnxruntime auf
+    SentenceTransformer (CPU) zurückgegriffen.
+    """
+    if _cuda_available():
+        logger.info("CUDA available, using FP16 SentenceTransformer encoder on GPU")
+        return SentenceTransformer(EMBEDDING_MODEL, device="cuda").half()
+    try:
+        return OnnxSentenceEncoder.load()
+    except ImportError:
+        logger.info("optimum/onnxruntime not installed, using SentenceTransformer encoder")
+    except Exception as e:
+        logger.warning(f"ONNX encoder unavailable, using SentenceTransformer: {e}")
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CodingContext:
-    """Kontext für spezialisierte Coding-Sessions"""
+    """Kontext für spezialisierte Coding-Sessions (unveränderlich, per Referenz geteilt)"""
     mode: str  # 'lazy', 'vibing', 'rag', 'async', 'special'
     task_id: str
     priority: int
@@ -32,50 +133,46 @@ class CodingContext:
     domain: str
     start_time: datetime
     metadata: Dict[str, Any]
+    # Monotoner Startzeitpunkt für Latenzmessung (start_time bleibt Wanduhr-Zeitstempel)
+    start_perf: float = field(default_factory=time.perf_counter)
 
-class BloomFilter:
-    """Spezialisierte Datenstruktur für effizienten Duplicate-Check"""
-    def __init__(self, expected_items: int, false_positive_rate: float = 0.01):
-        self.size = self._optimal_size(expected_items, false_positive_rate)
-        self.hash_count = self._optimal_hash_count(self.size, expected_items)
-        self.bit_array = [0] * self.size
-        
-    def _optimal_size(self, n: int, p: float) -> int:
-        return int(-(n * math.log(p)) / (math.log(2) ** 2))
-    
-    def _optimal_hash_count(self, m: int, n: int) -> int:
-        return int((m / n) * math.log(2))
-    
-    def _hashes(self, item: str) -> Generator[int, None, None]:
-        for seed in range(self.hash_count):
-            yield mmh3.hash(item, seed) % self.size
-    
-    def add(self, item: str) -> None:
-        for hash_val in self._hashes(item):
-            self.bit_array[hash_val] = 1
-    
-    def contains(self, item: str) -> bool:
-        return all(self.bit_array[hash_val] for hash_val in self._hashes(item))
+class LRUCache(OrderedDict):
+    """Dict mit LRU-Verdrängung, sobald mehr als maxsize Einträge vorliegen"""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+    
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
 
 class LazyCodeAgent:
     """Agent für produktive Faulheit und Lazy Evaluation"""
     
-    def __init__(self):
-        self.cache = {}
-        self.computed_items = BloomFilter(10000)
+    def __init__(self, cache_size: int = 4096):
+        # Einziger, begrenzter Ergebnis-Cache
+        self.cache = LRUCache(cache_size)
         
-    @lru_cache(maxsize=1000)
     def lazy_compute(self, task: str, complexity: str = "medium") -> str:
         """Lazy evaluation von Code-Generierung"""
         logger.info(f"Lazy computing: {task} (complexity: {complexity})")
         
-        if self.computed_items.contains(task):
-            return self.cache.get(task, "Already computed")
+        cached = self.cache.get((task, complexity))
+        if cached is not None:
+            return cached
         
         # Simuliere CodeLLM CLI Integration
         result = self._generate_lazy_code(task, complexity)
-        self.cache[task] = result
-        self.computed_items.add(task)
+        self.cache[(task, complexity)] = result
         
         return result
     
@@ -141,13 +238,25 @@ class VibingCodeAgent:
         }
         return complexity_mapping.get(context.estimated_complexity, 90)
 
+_RAG_PROMPT_HEADER = "\nNutze nur diese Kontexte für die Code-Generierung:\n"
+_RAG_PROMPT_FOOTER = """
+
+Domain: {domain}
+Komplexität: {complexity}
+Coding-Modus: {mode}
+
+Aufgabe: {query}
+
+Generiere Code (Python, gut dokumentiert, testbar):
+"""
+
 class RAGCodeAgent:
     """Agent für Retrieval-Augmented Generation in Coding"""
     
     def __init__(self):
-        self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        self.knowledge_base = SimpleVectorStore()
-        self.retrieval_cache = {}
+        self.embedding_model = _get_encoder()
+        self.knowledge_base = SimpleVectorStore(encoder=self.embedding_model)
+        self.retrieval_cache = LRUCache(2048)
         
     async def rag_code_generation(self, query: str, context: CodingContext) -> str:
         """RAG-basierte Code-Generierung"""
@@ -166,13 +275,14 @@ class RAGCodeAgent:
     
     async def _retrieve_context(self, query: str, context: CodingContext) -> List[str]:
         """Retrievt relevante Code-Beispiele und Dokumentation"""
-        cache_key = hashlib.md5(f"{query}_{context.domain}".encode()).hexdigest()
+        cache_key = mmh3.hash128(f"{query}\0{context.domain}")
         
-        if cache_key in self.retrieval_cache:
-            return self.retrieval_cache[cache_key]
+        cached = self.retrieval_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Semantic search in knowledge base
-        results = self.knowledge_base.search(query, k=4)
+        # Semantic search in knowledge base (gleichzeitige Queries werden gebatcht)
+        results = await self.knowledge_base.search_async(query, k=4)
         
         # Cache results
         self.retrieval_cache[cache_key] = results
@@ -181,21 +291,20 @@ class RAGCodeAgent:
     
     def _build_augmented_prompt(self, query: str, docs: List[str], context: CodingContext) -> str:
         """Baut kontextuellen Prompt für Code-Generation"""
-        context_section = "\n".join([f"Context {i+1}: {doc}" for i, doc in enumerate(docs)])
-        
-        prompt = f"""
-Nutze nur diese Kontexte für die Code-Generierung:
-{context_section}
-
-Domain: {context.domain}
-Komplexität: {context.estimated_complexity}
-Coding-Modus: {context.mode}
-
-Aufgabe: {query}
-
-Generiere Code (Python, gut dokumentiert, testbar):
-"""
-        return prompt
+        buf = io.StringIO()
+        buf.write(_RAG_PROMPT_HEADER)
+        for i, doc in enumerate(docs, 1):
+            if i > 1:
+                buf.write("\n")
+            buf.write(f"Context {i}: ")
+            buf.write(doc)
+        buf.write(_RAG_PROMPT_FOOTER.format(
+            domain=context.domain,
+            complexity=context.estimated_complexity,
+            mode=context.mode,
+            query=query
+        ))
+        return buf.getvalue()
     
     async def _generate_with_context(self, prompt: str) -> str:
         """Simuliert CodeLLM CLI Integration"""
@@ -205,23 +314,29 @@ Generiere Code (Python, gut dokumentiert, testbar):
 class AsyncCodeAgent:
     """Agent für asynchrone und nebenläufige Programmierung"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 10):
         self.active_tasks = {}
-        self.semaphore = asyncio.Semaphore(10)
+        self.max_workers = max_workers
         
     async def async_code_generation(self, tasks: List[str], context: CodingContext) -> List[str]:
         """Parallele Code-Generierung für multiple Tasks"""
         logger.info(f"Async processing {len(tasks)} tasks")
         
-        async def process_task(task: str) -> str:
-            async with self.semaphore:
-                return await self._generate_async_pattern(task, context)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, task in enumerate(tasks):
+            queue.put_nowait((index, task))
+        results: List[Any] = [None] * len(tasks)
         
-        # Parallele Verarbeitung mit Backpressure Control
-        results = await asyncio.gather(
-            *[process_task(task) for task in tasks],
-            return_exceptions=True
-        )
+        async def worker() -> None:
+            while not queue.empty():
+                index, task = queue.get_nowait()
+                try:
+                    results[index] = await self._generate_async_pattern(task, context)
+                except Exception as e:
+                    results[index] = e
+        
+        # Feste Anzahl Worker statt eines Tasks pro Eintrag (Pool = Backpressure)
+        await asyncio.gather(*[worker() for _ in range(min(self.max_workers, len(tasks)))])
         
         return [r for r in results if not isinstance(r, Exception)]
     
@@ -266,34 +381,161 @@ async def streaming_{task.replace(' ', '_')}():
         yield processed
 """
 
+class EmbeddingBatcher:
+    """Dynamisches Micro-Batching für Embedding-Anfragen
+    
+    Gleichzeitige embed()-Aufrufe werden bis max_batch_size Einträge oder
+    max_wait Sekunden gesammelt und in einem encode-Aufruf (im Worker-Thread)
+    berechnet. Ergebnisse sind L2-normalisiert.
+    """
+    
+    def __init__(self, encoder, max_batch_size: int = 32, max_wait: float = 0.02):
+        self.encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def embed(self, text: str) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await asyncio.get_running_loop().run_in_executor(None, partial(
+                    self.encoder.encode, texts,
+                    batch_size=self.max_batch_size, normalize_embeddings=True
+                ))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(np.asarray(embedding, dtype=np.float32))
+
+
 class SimpleVectorStore:
-    """Einfacher Vector Store für RAG"""
+    """Einfacher Vector Store für RAG
     
-    def __init__(self):
-        self.embeddings = []
+    Embeddings werden beim Einfügen L2-normalisiert und zeilenweise in einem
+    zusammenhängenden float32-Puffer abgelegt, der bei Bedarf verdoppelt wird;
+    die Suche ist damit ein einziges Matrix-Vektor-Produkt über alle Dokumente.
+    """
+    
+    def __init__(self, encoder=None, initial_capacity: int = 64):
         self.documents = []
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        self.model = encoder if encoder is not None else _get_encoder()
+        self.batcher = EmbeddingBatcher(self.model)
+        self.initial_capacity = initial_capacity
+        self._buffer: Optional[np.ndarray] = None
+        self._size = 0
+    
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Belegte Zeilen des Puffers (View, keine Kopie)"""
+        if self._buffer is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._buffer[:self._size]
     
     def add_document(self, text: str) -> None:
-        embedding = self.model.encode([text])[0]
-        self.embeddings.append(embedding)
+        embedding = self.model.encode([text])[0].astype(np.float32)
+        self._add_embedding(text, _l2_normalize(embedding))
+    
+    def add_documents(self, texts: List[str]) -> None:
+        """Mehrere Dokumente mit einem einzigen encode-Aufruf hinzufügen"""
+        if not texts:
+            return
+        embeddings = self.model.encode(
+            texts, batch_size=32, normalize_embeddings=True, show_progress_bar=False
+        )
+        self._append_rows(np.asarray(embeddings, dtype=np.float32))
+        self.documents.extend(texts)
+    
+    async def add_document_async(self, text: str) -> None:
+        """Wie add_document, aber über den Micro-Batcher"""
+        self._add_embedding(text, await self.batcher.embed(text))
+    
+    def _add_embedding(self, text: str, embedding: np.ndarray) -> None:
+        self._append_rows(embedding[None, :])
         self.documents.append(text)
     
+    def _append_rows(self, rows: np.ndarray) -> None:
+        count, dim = rows.shape
+        if self._buffer is None:
+            capacity = max(self.initial_capacity, count)
+            self._buffer = np.empty((capacity, dim), dtype=np.float32)
+        elif self._size + count > len(self._buffer):
+            capacity = max(2 * len(self._buffer), self._size + count)
+            grown = np.empty((capacity, dim), dtype=np.float32)
+            grown[:self._size] = self._buffer[:self._size]
+            self._buffer = grown
+        self._buffer[self._size:self._size + count] = rows
+        self._size += count
+    
     def search(self, query: str, k: int = 4) -> List[str]:
-        if not self.embeddings:
+        if not self._size:
             return []
         
-        query_embedding = self.model.encode([query])[0]
-        similarities = []
+        query_embedding = self.model.encode([query], normalize_embeddings=True)[0].astype(np.float32)
+        return self.search_by_embedding(query_embedding, k)
+    
+    async def search_async(self, query: str, k: int = 4) -> List[str]:
+        """Wie search, aber das Query-Embedding läuft über den Micro-Batcher"""
+        if not self._size:
+            return []
         
-        for i, doc_embedding in enumerate(self.embeddings):
-            similarity = np.dot(query_embedding, doc_embedding) / (
-                np.linalg.norm(query_embedding) * np.linalg.norm(doc_embedding)
-            )
-            similarities.append((i, similarity))
+        return self.search_by_embedding(await self.batcher.embed(query), k)
+    
+    def search_by_embedding(self, query_embedding: np.ndarray, k: int = 4) -> List[str]:
+        """Top-k Dokumente für ein bereits L2-normalisiertes Query-Embedding"""
+        if not self._size:
+            return []
         
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [self.documents[i] for i, _ in similarities[:k]]
+        similarities = self.embeddings @ query_embedding
+        
+        # Top-k ohne vollständige Sortierung
+        k = min(k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [self.documents[i] for i in top]
+
+# Schlüsselwörter je Modus; Reihenfolge bestimmt den Tie-Break in _detect_optimal_mode
+_MODE_KEYWORDS = {
+    "lazy": ["generator", "lazy", "on-demand", "streaming"],
+    "vibing": ["flow", "creative", "prototype", "explore"],
+    "rag": ["knowledge", "context", "documentation", "examples"],
+    "async": ["concurrent", "parallel", "async", "await", "batch"]
+}
+_KEYWORD_MODE = {word: mode for mode, words in _MODE_KEYWORDS.items() for word in words}
+# Eine Alternation für alle Keywords, längste zuerst, damit der Scan den Text nur einmal liest
+_KEYWORD_RE = re.compile("|".join(
+    re.escape(word) for word in sorted(_KEYWORD_MODE, key=len, reverse=True)
+))
 
 class SpecializedCodingOrchestrator:
     """Hauptorchestrator für alle spezialisierten Coding-Agenten"""
@@ -328,14 +570,13 @@ class SpecializedCodingOrchestrator:
             "Database connection pooling strategies"
         ]
         
-        for pattern in code_patterns:
-            self.rag_agent.knowledge_base.add_document(pattern)
+        self.rag_agent.knowledge_base.add_documents(code_patterns)
     
     async def process_coding_request(self, request: str, mode: str = "auto") -> Dict[str, Any]:
         """Verarbeitet Coding-Anfrage mit spezialisiertem Agenten"""
         context = CodingContext(
             mode=mode,
-            task_id=hashlib.md5(request.encode()).hexdigest()[:8],
+            task_id=f"{mmh3.hash(request, signed=False):08x}",
             priority=1,
             estimated_complexity="medium",
             domain="general",
@@ -360,21 +601,13 @@ class SpecializedCodingOrchestrator:
     
     def _detect_optimal_mode(self, request: str) -> str:
         """Automatische Erkennung des optimalen Coding-Modus"""
-        keywords = {
-            "lazy": ["generator", "lazy", "on-demand", "streaming"],
-            "vibing": ["flow", "creative", "prototype", "explore"],
-            "rag": ["knowledge", "context", "documentation", "examples"],
-            "async": ["concurrent", "parallel", "async", "await", "batch"]
-        }
-        
-        request_lower = request.lower()
-        scores = {}
-        
-        for mode, words in keywords.items():
-            score = sum(1 for word in words if word in request_lower)
-            scores[mode] = score
+        # Jedes Keyword zählt höchstens einmal, wie beim früheren Substring-Test
+        matched = set(_KEYWORD_RE.findall(request.lower()))
+        scores = Counter(_KEYWORD_MODE[word] for word in matched)
         
-        return max(scores, key=scores.get) if max(scores.values()) > 0 else "vibing"
+        if not scores:
+            return "vibing"
+        return max(_MODE_KEYWORDS, key=lambda mode: scores[mode])
     
     async def _route_to_agent(self, request: str, mode: str, context: CodingContext) -> Any:
         """Routet Anfrage an spezialisierten Agenten"""
@@ -392,7 +625,7 @@ class SpecializedCodingOrchestrator:
     
     def _gather_metrics(self, context: CodingContext) -> Dict[str, Any]:
         """Sammelt Performance-Metriken"""
-        duration = (datetime.now() - context.start_time).total_seconds()
+        duration = time.perf_counter() - context.start_perf
         
         return {
             "duration_seconds": duration,
@@ -9,13 +9,23 @@ Startet AUTARK Knowledge Integration System Server.
 import json
 import asyncio
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 import sys
+from collections import deque
+from itertools import islice
 from datetime import datetime
 
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_SRC_DIR = _BASE_DIR / "src"
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC_DIR))
 
 try:
     from akis.retrieval.hybrid_retriever import AKISRetrievalEngine
@@ -31,6 +41,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Obergrenze für die im Speicher gehaltene Query-Historie
+QUERY_HISTORY_LIMIT = 1024
+
 
 class AKISServer:
     """AKIS Server für Knowledge Retrieval"""
@@ -42,38 +55,54 @@ class AKISServer:
         
         # Initialize Retrieval Engine
         self.retrieval_engine = AKISRetrievalEngine(str(self.data_dir))
-        self.query_history = []
+        self.query_history = deque(maxlen=QUERY_HISTORY_LIMIT)
         self.server_stats = {
             'start_time': datetime.now(),
             'total_queries': 0,
             'successful_queries': 0,
+            'failed_queries': 0,
             'average_response_time': 0.0
         }
         
+        # Welford-Akkumulatoren für Antwortzeiten (nur erfolgreiche Queries)
+        self._stats_lock = threading.Lock()
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        
+        # Gemeinsamer Pool für die (blockierende) Retrieval Engine
+        self._executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="akis-query"
+        )
+        
         logger.info(f"AKIS Server initialized with data_dir: {data_dir}")
     
-    def process_query(self, query: str, context_params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Verarbeite Knowledge Query"""
-        start_time = datetime.now()
+    async def process_query(self, query: str, context_params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Verarbeite Knowledge Query (Retrieval läuft im Thread-Pool)"""
+        timestamp = datetime.now().isoformat()
+        start = time.perf_counter()
         
         try:
             # Erstelle Retrieval Context
             context = self._create_context(context_params or {})
             
             # Führe Query durch
-            result = self.retrieval_engine.query(query, context)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, self.retrieval_engine.query, query, context
+            )
             
             # Update Statistics
-            end_time = datetime.now()
-            response_time = (end_time - start_time).total_seconds()
+            response_time = time.perf_counter() - start
             
-            self.server_stats['total_queries'] += 1
-            self.server_stats['successful_queries'] += 1
-            self._update_average_response_time(response_time)
+            with self._stats_lock:
+                self.server_stats['total_queries'] += 1
+                self.server_stats['successful_queries'] += 1
+                self._update_average_response_time(response_time)
             
             # Add query to history
             query_record = {
-                'timestamp': start_time.isoformat(),
+                'timestamp': timestamp,
                 'query': query,
                 'context': context_params,
                 'response_time': response_time,
@@ -85,7 +114,7 @@ class AKISServer:
             # Enhanced result
             enhanced_result = {
                 'query': query,
-                'timestamp': start_time.isoformat(),
+                'timestamp': timestamp,
                 'response_time_seconds': response_time,
                 'status': 'success',
                 'results': result,
@@ -100,13 +129,14 @@ class AKISServer:
             
         except Exception as e:
             # Update error statistics
-            end_time = datetime.now()
-            response_time = (end_time - start_time).total_seconds()
+            response_time = time.perf_counter() - start
             
-            self.server_stats['total_queries'] += 1
+            with self._stats_lock:
+                self.server_stats['total_queries'] += 1
+                self.server_stats['failed_queries'] += 1
             
             error_record = {
-                'timestamp': start_time.isoformat(),
+                'timestamp': timestamp,
                 'query': query,
                 'context': context_params,
                 'response_time': response_time,
@@ -119,7 +149,7 @@ class AKISServer:
             
             return {
                 'query': query,
-                'timestamp': start_time.isoformat(),
+                'timestamp': timestamp,
                 'response_time_seconds': response_time,
                 'status': 'error',
                 'error': str(e),
@@ -129,6 +159,10 @@ class AKISServer:
                 }
             }
     
+    def close(self):
+        """Beende den Query-Thread-Pool"""
+        self._executor.shutdown(wait=True)
+    
     def _create_context(self, params: Dict[str, Any]) -> RetrievalContext:
         """Erstelle RetrievalContext aus Parameters"""
         
@@ -158,31 +192,35 @@ class AKISServer:
         return context
     
     def _update_average_response_time(self, new_response_time: float):
-        """Update running average response time"""
-        current_avg = self.server_stats['average_response_time']
-        total_queries = self.server_stats['total_queries']
-        
-        if total_queries == 1:
-            self.server_stats['average_response_time'] = new_response_time
-        else:
-            # Running average
-            self.server_stats['average_response_time'] = (
-                (current_avg * (total_queries - 1) + new_response_time) / total_queries
-            )
+        """Update running mean/variance (Welford); Aufrufer hält _stats_lock"""
+        self._n += 1
+        delta = new_response_time - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (new_response_time - self._mean)
+        self.server_stats['average_response_time'] = self._mean
+    
+    def _recent_queries(self, count: int) -> List[Dict[str, Any]]:
+        """Hole die letzten `count` Einträge der Query-Historie"""
+        start = max(0, len(self.query_history) - count)
+        return list(islice(self.query_history, start, None))
     
     def get_server_status(self) -> Dict[str, Any]:
         """Hole Server Status"""
         uptime = datetime.now() - self.server_stats['start_time']
         
+        with self._stats_lock:
+            statistics = dict(self.server_stats)
+            statistics['response_time_std'] = math.sqrt(self._m2 / self._n) if self._n else 0.0
+        
         status = {
             'status': 'running',
             'uptime_seconds': uptime.total_seconds(),
             'uptime_human': str(uptime),
-            'statistics': self.server_stats,
+            'statistics': statistics,
             'data_directory': str(self.data_dir),
-            'recent_queries': self.query_history[-10:] if self.query_history else [],
+            'recent_queries': self._recent_queries(10),
             'success_rate': (
-                self.server_stats['successful_queries'] / max(1, self.server_stats['total_queries'])
+                statistics['successful_queries'] / max(1, statistics['total_queries'])
             ) * 100
         }
         
@@ -215,13 +253,14 @@ class AKISServer:
                     print(f"   Total Queries: {status['statistics']['total_queries']}")
                     print(f"   Success Rate: {status['success_rate']:.1f}%")
                     print(f"   Avg Response Time: {status['statistics']['average_response_time']:.3f}s")
+                    print(f"   Response Time Std: {status['statistics']['response_time_std']:.3f}s")
                     continue
                 elif user_input.lower() == 'history':
                     print(f"\n📜 Recent Queries:")
                     if not self.query_history:
                         print("   No queries yet")
                     else:
-                        for i, query in enumerate(self.query_history[-5:], 1):
+                        for i, query in enumerate(self._recent_queries(5), 1):
                             status_icon = "✅" if query['status'] == 'success' else "❌"
                             print(f"   {i}. {status_icon} {query['query'][:50]}... ({query['response_time']:.3f}s)")
                     continue
@@ -230,7 +269,7 @@ class AKISServer:
                 
                 # Process query
                 print("🔄 Processing...")
-                result = self.process_query(user_input)
+                result = asyncio.run(self.process_query(user_input))
                 
                 if result['status'] == 'success':
                     print(f"\n✅ Query successful ({result['response_time_seconds']:.3f}s)")
@@ -289,12 +328,15 @@ def main():
         # Initialize Server
         akis_server = AKISServer(args.data_dir)
         
-        if args.mode == 'interactive':
-            akis_server.run_interactive_mode()
-        else:
-            print(f"🚀 Starting AKIS Server on port {args.port}")
-            print("Note: Full HTTP server implementation would go here")
-            print("For now, use interactive mode: --mode interactive")
+        try:
+            if args.mode == 'interactive':
+                akis_server.run_interactive_mode()
+            else:
+                print(f"🚀 Starting AKIS Server on port {args.port}")
+                print("Note: Full HTTP server implementation would go here")
+                print("For now, use interactive mode: --mode interactive")
+        finally:
+            akis_server.close()
             
     except Exception as e:
         logger.error(f"Failed to start AKIS Server: {e}")
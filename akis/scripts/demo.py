@@ -6,26 +6,143 @@ AKIS Demo
 Demonstration des AUTARK Knowledge Integration Systems
 """
 
+import os
 import sys
 from pathlib import Path
 import subprocess
+import threading
 import time
 import json
+from itertools import islice
+
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_SRC_DIR = _BASE_DIR / "src"
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC_DIR))
+_SCRIPTS_DIR = _BASE_DIR / "scripts"
+_DATA_DIR = _BASE_DIR / "data"
+_MANIFESTS_DIR = _BASE_DIR / "manifests"
+
+# Manifeste dürfen als YAML oder JSON vorliegen; wie MANIFEST_SUFFIXES in
+# akis.ingestion.pipeline (hier ohne die Pipeline und ihre Abhängigkeiten zu importieren)
+MANIFEST_SUFFIXES = ('.yml', '.yaml', '.json')
+
+# Statische Demo-Texte (einmal beim Import angelegt)
+_SAMPLE_QUERIES = (
+    "How do I create a video with AI?",
+    "What tools are available for video editing?",
+    "Show me knowledge integration capabilities",
+    "How do I deploy to production?",
+    "What are the maturity levels?",
+)
+
+_ARCHITECTURE_LAYERS = (
+    "Layer 1: Storage Primitives (SQLite)",
+    "Layer 2: Ingestion & Normalization",
+    "Layer 3: Ontology & Knowledge Graph",
+    "Layer 4: Embeddings & Indices",
+    "Layer 5: Reasoning Adapters",
+    "Layer 6: Evaluation & Telemetrie",
+    "Layer 7: Governance & Security",
+    "Layer 8: Delivery",
+)
+
+_FEATURES = (
+    "🔍 Hybrid Retrieval: Graph + Vector + Lexical",
+    "🎯 Skill-Level Adaptive Responses",
+    "📊 6-Level Maturity Progression",
+    "🛡️  Governance & Compliance",
+    "📱 Offline-First Architecture",
+    "🔗 Cross-Domain Knowledge Linking",
+    "📈 Performance Benchmarking",
+    "🎛️  Tool Manifest Configuration",
+)
+
+_INTEGRATIONS = (
+    "✅ Standalone Python Server",
+    "✅ REST API Endpoint",
+    "✅ CLI Tool Interface",
+    "✅ Jupyter Notebook Integration",
+    "🔄 VS Code Extension (Planned)",
+    "🔄 Web Dashboard (Planned)",
+    "🔄 Slack Bot (Planned)",
+)
+
+_NEXT_STEPS = (
+    "1. Run: python scripts/init_akis.py --data-dir ./data",
+    "2. Test: python scripts/akis_server.py --mode interactive",
+    "3. Integrate: Import AKIS into existing AUTARK system",
+    "4. Configure: Add your tool manifests",
+    "5. Scale: Deploy to production environment",
+)
+
+_ENTITIES = (
+    "Tool: Represents external tools and their capabilities",
+    "Capability: Specific functionality a tool provides",
+    "Document: Knowledge artifacts (docs, examples, tutorials)",
+    "Concept: Abstract knowledge units",
+    "Relation: Connections between entities",
+    "BenchmarkCase: Performance validation scenarios",
+    "PolicyRule: Governance and compliance rules",
+)
+
+_MATURITY_LEVELS = (
+    "1. AWARENESS_EXPLORATION: Discovery phase",
+    "2. BASIC_EXECUTION: Simple task completion",
+    "3. EFFICIENT_OPERATION: Optimized workflows",
+    "4. ADAPTIVE_OPTIMIZATION: Dynamic adaptation",
+    "5. PREDICTIVE_INTELLIGENCE: Proactive assistance",
+    "6. AUTONOMOUS_MASTERY: Self-directed operation",
+)
+
+
+def _write_lines(lines, prefix="   "):
+    """Gib eine Sektion mit einem einzigen write aus"""
+    sys.stdout.write("".join(f"{prefix}{line}\n" for line in lines))
+
+def _walk_files(path):
+    """Rekursiver os.scandir-Walk; liefert DirEntry-Objekte aller Dateien"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
 
 def run_command(cmd, description="", check=True):
-    """Execute command with pretty output"""
+    """Execute command with pretty output (streamed line by line on a terminal)"""
     print(f"\n🔧 {description}")
     print(f"   Command: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=check)
-        if result.stdout:
-            print("✅ Output:")
-            for line in result.stdout.strip().split('\n'):
-                print(f"   {line}")
+        with subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, text=True, bufsize=1
+        ) as proc:
+            # stderr parallel leeren, damit das Kind nicht an einer vollen Pipe blockiert
+            stderr_lines = []
+            drain = threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+            drain.start()
+            
+            if sys.stdout.isatty():
+                # Interaktiv: Zeilen sofort durchreichen
+                header_printed = False
+                for line in proc.stdout:
+                    if not header_printed:
+                        print("✅ Output:")
+                        header_printed = True
+                    print(f"   {line}", end="")
+            else:
+                # Umgeleitet (CI, Datei): gesamte Ausgabe mit einem write
+                output = proc.stdout.read().strip()
+                if output:
+                    sys.stdout.write("✅ Output:\n   " + output.replace("\n", "\n   ") + "\n")
+            drain.join()
+        
+        result = subprocess.CompletedProcess(cmd, proc.returncode, None, "".join(stderr_lines))
+        if check:
+            result.check_returncode()
         return result
     except subprocess.CalledProcessError as e:
         print(f"❌ Error: {e}")
@@ -36,131 +153,93 @@ def run_command(cmd, description="", check=True):
         print(f"❌ Exception: {e}")
         return e
 
-def demo_akis():
-    """AKIS Demo Flow"""
+def demo_akis(isolate=False, pause=0.5):
+    """AKIS Demo Flow
+    
+    isolate: init_akis in eigenem Interpreter statt in-process;
+    pause: Wartezeit je simulierter Query in Sekunden (0 für CI).
+    """
     
     print("="*60)
     print("🧠 AUTARK Knowledge Integration System")
     print("🎯 Live Demonstration")
     print("="*60)
     
-    base_dir = Path(__file__).parent.parent
-    scripts_dir = base_dir / "scripts"
-    
     # Step 1: Initialize AKIS
     print("\n📋 Step 1: AKIS Initialization")
-    init_script = scripts_dir / "init_akis.py"
+    init_script = _SCRIPTS_DIR / "init_akis.py"
     
-    if init_script.exists():
-        run_command([
-            sys.executable, str(init_script), 
-            "--data-dir", str(base_dir / "data"),
-            "--manifests-dir", str(base_dir / "manifests"),
-            "--docs-dir", str(base_dir / "docs")
-        ], "Initializing AKIS Knowledge Base")
-    else:
+    if not init_script.exists():
         print("❌ init_akis.py not found")
         return
     
-    time.sleep(2)
+    if isolate:
+        run_command([
+            sys.executable, str(init_script),
+            "--base-dir", str(_DATA_DIR),
+            "--manifests-dir", str(_MANIFESTS_DIR)
+        ], "Initializing AKIS Knowledge Base")
+    else:
+        # In-process: spart den Start eines zweiten Interpreters samt Re-Import
+        print("\n🔧 Initializing AKIS Knowledge Base")
+        try:
+            if str(_SCRIPTS_DIR) not in sys.path:
+                sys.path.insert(0, str(_SCRIPTS_DIR))
+            from init_akis import init_akis
+            init_akis(str(_DATA_DIR), str(_MANIFESTS_DIR))
+        except Exception as e:
+            print(f"❌ Exception: {e}")
+    
+    time.sleep(pause * 4)
     
     # Step 2: Check Data Directory
     print("\n📁 Step 2: Data Directory Overview")
-    data_dir = base_dir / "data"
+    data_dir = _DATA_DIR
     
     if data_dir.exists():
         print("✅ Data directory contents:")
-        for item in data_dir.rglob("*"):
-            if item.is_file():
-                size = item.stat().st_size
-                print(f"   📄 {item.relative_to(data_dir)} ({size} bytes)")
+        # Größe direkt aus dem DirEntry; wie bei is_file() in _walk_files werden
+        # Symlinks auf Dateien aufgelöst und mit der Größe des Ziels gelistet
+        prefix_len = len(os.path.join(data_dir, ""))
+        _write_lines(
+            f"📄 {entry.path[prefix_len:]} ({entry.stat().st_size} bytes)"
+            for entry in _walk_files(data_dir)
+        )
     else:
         print("❌ Data directory not found")
     
     # Step 3: Test Queries (Simulated)
     print("\n🔍 Step 3: Query Examples")
     
-    sample_queries = [
-        "How do I create a video with AI?",
-        "What tools are available for video editing?",
-        "Show me knowledge integration capabilities",
-        "How do I deploy to production?",
-        "What are the maturity levels?",
-    ]
-    
     print("📋 Sample Queries (would be processed by AKIS):")
-    for i, query in enumerate(sample_queries, 1):
+    for i, query in enumerate(_SAMPLE_QUERIES, 1):
         print(f"   {i}. {query}")
         
         # Simulate query processing
         print(f"      🔄 Processing...")
-        time.sleep(0.5)
+        time.sleep(pause)
         print(f"      ✅ Would return: Tool suggestions, documentation, examples")
     
     # Step 4: Show Architecture
     print("\n🏗️  Step 4: AKIS Architecture Overview")
     
-    architecture_layers = [
-        "Layer 1: Storage Primitives (SQLite)",
-        "Layer 2: Ingestion & Normalization",
-        "Layer 3: Ontology & Knowledge Graph",
-        "Layer 4: Embeddings & Indices",
-        "Layer 5: Reasoning Adapters",
-        "Layer 6: Evaluation & Telemetrie",
-        "Layer 7: Governance & Security",
-        "Layer 8: Delivery"
-    ]
-    
     print("📊 AKIS 7-Layer Architecture:")
-    for layer in architecture_layers:
-        print(f"   🔹 {layer}")
+    _write_lines(_ARCHITECTURE_LAYERS, prefix="   🔹 ")
     
     # Step 5: Show Features
     print("\n⭐ Step 5: Key Features")
     
-    features = [
-        "🔍 Hybrid Retrieval: Graph + Vector + Lexical",
-        "🎯 Skill-Level Adaptive Responses",
-        "📊 6-Level Maturity Progression",
-        "🛡️  Governance & Compliance",
-        "📱 Offline-First Architecture",
-        "🔗 Cross-Domain Knowledge Linking",
-        "📈 Performance Benchmarking",
-        "🎛️  Tool Manifest Configuration"
-    ]
-    
-    for feature in features:
-        print(f"   {feature}")
+    _write_lines(_FEATURES)
     
     # Step 6: Integration Options
     print("\n🔌 Step 6: Integration Options")
     
-    integrations = [
-        "✅ Standalone Python Server",
-        "✅ REST API Endpoint",
-        "✅ CLI Tool Interface",
-        "✅ Jupyter Notebook Integration",
-        "🔄 VS Code Extension (Planned)",
-        "🔄 Web Dashboard (Planned)",
-        "🔄 Slack Bot (Planned)"
-    ]
-    
-    for integration in integrations:
-        print(f"   {integration}")
+    _write_lines(_INTEGRATIONS)
     
     # Step 7: Next Steps
     print("\n🚀 Step 7: Next Steps")
     
-    next_steps = [
-        "1. Run: python scripts/init_akis.py --data-dir ./data",
-        "2. Test: python scripts/akis_server.py --mode interactive",
-        "3. Integrate: Import AKIS into existing AUTARK system",
-        "4. Configure: Add your tool manifests",
-        "5. Scale: Deploy to production environment"
-    ]
-    
-    for step in next_steps:
-        print(f"   {step}")
+    _write_lines(_NEXT_STEPS)
     
     print("\n" + "="*60)
     print("🎉 AKIS Demo Complete!")
@@ -173,19 +252,22 @@ def show_manifest_examples():
     
     print("\n📋 Tool Manifest Examples")
     
-    base_dir = Path(__file__).parent.parent
-    manifests_dir = base_dir / "manifests" / "tools"
+    manifests_dir = _MANIFESTS_DIR / "tools"
     
     if manifests_dir.exists():
-        for manifest_file in manifests_dir.glob("*.yml"):
+        manifest_files = sorted(
+            path for path in manifests_dir.iterdir() if path.suffix in MANIFEST_SUFFIXES
+        )
+        for manifest_file in manifest_files:
             print(f"\n📄 {manifest_file.name}:")
             try:
-                content = manifest_file.read_text()
-                # Show first few lines
-                lines = content.split('\n')[:10]
-                for line in lines:
-                    print(f"   {line}")
-                if len(content.split('\n')) > 10:
+                # Nur die ersten Zeilen lesen, nicht das ganze Manifest
+                with manifest_file.open('r', encoding='utf-8') as fh:
+                    head = list(islice(fh, 10))
+                    has_more = fh.readline() != ''
+                for line in head:
+                    print("   " + line.rstrip("\n"))
+                if has_more:
                     print("   ...")
             except Exception as e:
                 print(f"   ❌ Error reading: {e}")
@@ -198,32 +280,11 @@ def show_ontology_info():
     
     print("\n🧬 Ontology Structure")
     
-    entities = [
-        "Tool: Represents external tools and their capabilities",
-        "Capability: Specific functionality a tool provides",
-        "Document: Knowledge artifacts (docs, examples, tutorials)",
-        "Concept: Abstract knowledge units",
-        "Relation: Connections between entities",
-        "BenchmarkCase: Performance validation scenarios",
-        "PolicyRule: Governance and compliance rules"
-    ]
-    
     print("📊 Core Entities:")
-    for entity in entities:
-        print(f"   🔹 {entity}")
+    _write_lines(_ENTITIES, prefix="   🔹 ")
     
     print("\n📈 Maturity Levels:")
-    maturity_levels = [
-        "1. AWARENESS_EXPLORATION: Discovery phase",
-        "2. BASIC_EXECUTION: Simple task completion",
-        "3. EFFICIENT_OPERATION: Optimized workflows",
-        "4. ADAPTIVE_OPTIMIZATION: Dynamic adaptation",
-        "5. PREDICTIVE_INTELLIGENCE: Proactive assistance",
-        "6. AUTONOMOUS_MASTERY: Self-directed operation"
-    ]
-    
-    for level in maturity_levels:
-        print(f"   {level}")
+    _write_lines(_MATURITY_LEVELS)
 
 
 def main():
@@ -237,11 +298,21 @@ def main():
         default='full',
         help="Demo mode"
     )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run init_akis.py in a separate interpreter"
+    )
+    parser.add_argument(
+        "--fast", "--no-pause",
+        action="store_true",
+        help="Skip the simulated pauses (for CI and scripted runs)"
+    )
     
     args = parser.parse_args()
     
     if args.mode == 'full':
-        demo_akis()
+        demo_akis(isolate=args.isolate, pause=0.0 if args.fast else 0.5)
     elif args.mode == 'manifests':
         show_manifest_examples()
     elif args.mode == 'ontology':
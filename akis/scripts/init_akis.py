@@ -9,16 +9,26 @@ Initialisiert das AUTARK Knowledge Integration System.
 import json
 import logging
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 from typing import Dict, Any
 
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_SRC_DIR = _BASE_DIR / "src"
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC_DIR))
 
-from akis.ingestion.pipeline import IngestionPipeline
+from akis.ingestion.pipeline import IngestionPipeline, ManifestCache, MANIFEST_SUFFIXES
 from akis.retrieval.hybrid_retriever import AKISRetrievalEngine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -26,11 +36,36 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Statuszeilen ohne Zeitstempel auf stdout, sofort geschrieben: es sind nur wenige
+# Zeilen, und sie müssen in Reihenfolge mit den Log-Zeilen der Pipeline erscheinen
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+console = logging.getLogger(f"{__name__}.console")
+console.setLevel(logging.INFO)
+console.addHandler(_console_handler)
+console.propagate = False
+
+# Unterhalb dieser Manifest-Anzahl kostet der Start des Prozess-Pools mehr,
+# als die parallele Verarbeitung einspart
+_PARALLEL_MIN_MANIFESTS = 8
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Schreibe JSON eingerückt; nutzt orjson wenn verfügbar, sonst stdlib json"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
 def init_akis(base_dir: str, manifests_dir: str) -> Dict[str, Any]:
     """Initialize AKIS from manifests"""
     
-    print("🚀 Initializing AUTARK Knowledge Integration System...")
-    print("=" * 60)
+    console.info("🚀 Initializing AUTARK Knowledge Integration System...")
+    console.info("=" * 60)
     
     base_path = Path(base_dir)
     manifests_path = Path(manifests_dir)
@@ -43,28 +78,40 @@ def init_akis(base_dir: str, manifests_dir: str) -> Dict[str, Any]:
     data_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize Ingestion Pipeline
-    print("📥 Starting Ingestion Pipeline...")
-    pipeline = IngestionPipeline(str(data_dir))
+    console.info("📥 Starting Ingestion Pipeline...")
+    # Inkrementell: unveränderte Dokumentation wird aus dem letzten Lauf übernommen
+    pipeline = IngestionPipeline(str(data_dir), incremental=True)
     
     # Ingest all manifests
-    print(f"📁 Processing manifests from: {manifests_path}")
-    results = pipeline.ingest_directory(str(manifests_path))
+    console.info(f"📁 Processing manifests from: {manifests_path}")
+    # Ab _PARALLEL_MIN_MANIFESTS werden Manifeste samt Dokumentation parallel verarbeitet, die Pipeline
+    # übernimmt sie sequentiell; unveränderte Manifeste kommen aus dem Cache des letzten Laufs
+    manifest_cache = ManifestCache(str(data_dir))
+    manifest_count = sum(1 for path in manifests_path.rglob('*') if path.name.endswith(MANIFEST_SUFFIXES))
+    workers = min(os.cpu_count() or 1, manifest_count)
+    if manifest_count < _PARALLEL_MIN_MANIFESTS or workers < 2:
+        results = pipeline.ingest_directory(str(manifests_path), cache=manifest_cache)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = pipeline.ingest_directory(
+                str(manifests_path), executor=executor, cache=manifest_cache
+            )
+    manifest_cache.save()
     
     # Save processed data
-    print("💾 Saving processed data...")
+    console.info("💾 Saving processed data...")
     output_files = pipeline.save_processed_data()
     
     # Generate summary report
-    print("📊 Generating summary report...")
+    console.info("📊 Generating summary report...")
     report = pipeline.generate_summary_report()
     
     # Save report
     report_file = data_dir / "ingestion_report.json"
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    write_json(report_file, report)
     
     # Initialize Retrieval Engine
-    print("🔍 Initializing Retrieval Engine...")
+    console.info("🔍 Initializing Retrieval Engine...")
     retrieval_engine = AKISRetrievalEngine(str(data_dir))
     
     # Create summary
@@ -77,22 +124,22 @@ def init_akis(base_dir: str, manifests_dir: str) -> Dict[str, Any]:
         'report_file': str(report_file)
     }
     
-    print("\n" + "=" * 60)
-    print("✅ AKIS Initialization Complete!")
-    print("=" * 60)
-    print(f"📊 Summary:")
-    print(f"   Tools: {report['ingestion_summary']['tools_processed']}")
-    print(f"   Capabilities: {report['ingestion_summary']['capabilities_processed']}")
-    print(f"   Documents: {report['ingestion_summary']['documents_processed']}")
-    print(f"   Concepts: {report['ingestion_summary']['concepts_extracted']}")
-    print(f"📁 Data Directory: {data_dir}")
-    print(f"📋 Report: {report_file}")
+    console.info("\n" + "=" * 60)
+    console.info("✅ AKIS Initialization Complete!")
+    console.info("=" * 60)
+    console.info(f"📊 Summary:")
+    console.info(f"   Tools: {report['ingestion_summary']['tools_processed']}")
+    console.info(f"   Capabilities: {report['ingestion_summary']['capabilities_processed']}")
+    console.info(f"   Documents: {report['ingestion_summary']['documents_processed']}")
+    console.info(f"   Concepts: {report['ingestion_summary']['concepts_extracted']}")
+    console.info(f"📁 Data Directory: {data_dir}")
+    console.info(f"📋 Report: {report_file}")
     
     # Show recommendations
     if report['recommendations']:
-        print("\n💡 Recommendations:")
+        console.info("\n💡 Recommendations:")
         for rec in report['recommendations']:
-            print(f"   • {rec}")
+            console.info(f"   • {rec}")
     
     return summary
 
@@ -121,9 +168,8 @@ def main():
         summary = init_akis(args.base_dir, args.manifests_dir)
         
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
-            print(f"📄 Summary written to: {args.output}")
+            write_json(Path(args.output), summary)
+            console.info(f"📄 Summary written to: {args.output}")
             
     except Exception as e:
         logger.error(f"AKIS initialization failed: {e}")
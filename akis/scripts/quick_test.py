@@ -9,8 +9,12 @@ Schneller Test des AKIS Systems
 import sys
 from pathlib import Path
 
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_SRC_DIR = _BASE_DIR / "src"
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC_DIR))
+_DATA_DIR = _BASE_DIR / "data" / "data"
 
 try:
     from akis.retrieval.hybrid_retriever import AKISRetrievalEngine
@@ -20,12 +24,13 @@ try:
     print("="*60)
     
     # Initialize Engine
-    data_dir = Path(__file__).parent.parent / "data" / "data"
+    data_dir = _DATA_DIR
     if not data_dir.exists():
         print("❌ Data directory not found. Run init_akis.py first.")
         sys.exit(1)
     
     engine = AKISRetrievalEngine(str(data_dir))
+    engine.prime()
     print(f"✅ Retrieval Engine initialized: {data_dir}")
     
     # Create context
@@ -38,11 +43,11 @@ try:
     print(f"✅ Context created for {context.user_role}")
     
     # Test queries
-    test_queries = [
+    test_queries = (
         "How do I create a video with AI?",
         "What video editing capabilities are available?",
         "Show me knowledge integration features",
-    ]
+    )
     
     print("\n🔍 Testing Queries:")
     print("-" * 40)
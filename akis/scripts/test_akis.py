@@ -6,46 +6,97 @@ AKIS Test Suite
 Comprehensive testing for AUTARK Knowledge Integration System
 """
 
+import importlib.util
+import io
+import os
 import unittest
 import sys
 import tempfile
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_SRC_DIR = _BASE_DIR / "src"
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(_SRC_DIR))
 
-class TestAKISModels(unittest.TestCase):
-    """Test AKIS ontology models"""
-    
-    def setUp(self):
-        """Set up test"""
+_MANIFESTS_DIR_REL = Path("manifests") / "tools"
+_SAMPLE_MANIFEST = "video_creator.yml"
+
+try:
+    from akis.ontology.models import MaturityLevel, Tool, Capability, RetrievalContext
+    _MODELS_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Models not available: {e}")
+    _MODELS_AVAILABLE = False
+
+try:
+    from akis.retrieval.hybrid_retriever import KnowledgeGraph, VectorStore
+    _RETRIEVAL_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Retrieval not available: {e}")
+    _RETRIEVAL_AVAILABLE = False
+
+try:
+    from akis.ingestion.pipeline import ToolManifestParser, IngestionPipeline, ManifestCache
+    _INGESTION_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  Ingestion not available: {e}")
+    _INGESTION_AVAILABLE = False
+
+_SPEC_CACHE = {}
+
+
+def _find_component(name):
+    """Locate a module via find_spec without executing it; returns None or an error (cached)"""
+    if name not in _SPEC_CACHE:
         try:
-            from akis.ontology.models import MaturityLevel, Tool, Capability, RetrievalContext
-            self.MaturityLevel = MaturityLevel
-            self.Tool = Tool
-            self.Capability = Capability
-            self.RetrievalContext = RetrievalContext
-            self.models_available = True
+            found = importlib.util.find_spec(name) is not None
+            _SPEC_CACHE[name] = None if found else f"No module named '{name}'"
         except ImportError as e:
-            print(f"⚠️  Models not available: {e}")
-            self.models_available = False
+            _SPEC_CACHE[name] = str(e)
+    return _SPEC_CACHE[name]
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree via os.scandir, never following symlinks; errors are ignored"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        _fast_rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+@unittest.skipUnless(_MODELS_AVAILABLE, "Models not available")
+class TestAKISModels(unittest.TestCase):
+    """Test AKIS ontology models"""
     
     def test_maturity_levels(self):
         """Test maturity level enum"""
-        if not self.models_available:
-            self.skipTest("Models not available")
-        
         # Test all maturity levels exist
         levels = [
-            self.MaturityLevel.AWARENESS_EXPLORATION,
-            self.MaturityLevel.BASIC_EXECUTION,
-            self.MaturityLevel.EFFICIENT_OPERATION,
-            self.MaturityLevel.ADAPTIVE_OPTIMIZATION,
-            self.MaturityLevel.PREDICTIVE_INTELLIGENCE,
-            self.MaturityLevel.AUTONOMOUS_MASTERY
+            MaturityLevel.AWARENESS_EXPLORATION,
+            MaturityLevel.BASIC_EXECUTION,
+            MaturityLevel.EFFICIENT_OPERATION,
+            MaturityLevel.ADAPTIVE_OPTIMIZATION,
+            MaturityLevel.PREDICTIVE_INTELLIGENCE,
+            MaturityLevel.AUTONOMOUS_MASTERY
         ]
         
         self.assertEqual(len(levels), 6)
@@ -54,67 +105,50 @@ class TestAKISModels(unittest.TestCase):
     
     def test_tool_creation(self):
         """Test tool model creation"""
-        if not self.models_available:
-            self.skipTest("Models not available")
-        
-        tool = self.Tool(
+        tool = Tool(
             id="test_tool",
             name="Test Tool",
             version="1.0.0",
             description="A test tool",
             category="testing",
-            maturity_level=self.MaturityLevel.BASIC_EXECUTION,
+            maturity_level=MaturityLevel.BASIC_EXECUTION,
             capabilities=[]
         )
         
         self.assertEqual(tool.id, "test_tool")
         self.assertEqual(tool.name, "Test Tool")
-        self.assertEqual(tool.maturity_level, self.MaturityLevel.BASIC_EXECUTION)
+        self.assertEqual(tool.maturity_level, MaturityLevel.BASIC_EXECUTION)
     
     def test_retrieval_context(self):
         """Test retrieval context"""
-        if not self.models_available:
-            self.skipTest("Models not available")
-        
-        context = self.RetrievalContext(
+        context = RetrievalContext(
             user_id="test_user",
             user_role="developer",
-            required_maturity_level=self.MaturityLevel.EFFICIENT_OPERATION
+            required_maturity_level=MaturityLevel.EFFICIENT_OPERATION
         )
         
         self.assertEqual(context.user_id, "test_user")
         self.assertEqual(context.user_role, "developer")
-        self.assertEqual(context.required_maturity_level, self.MaturityLevel.EFFICIENT_OPERATION)
+        self.assertEqual(context.required_maturity_level, MaturityLevel.EFFICIENT_OPERATION)
 
 
+@unittest.skipUnless(_RETRIEVAL_AVAILABLE, "Retrieval not available")
 class TestAKISRetrieval(unittest.TestCase):
     """Test AKIS retrieval system"""
     
     def setUp(self):
         """Set up test"""
-        try:
-            from akis.retrieval.hybrid_retriever import KnowledgeGraph, VectorStore
-            self.KnowledgeGraph = KnowledgeGraph
-            self.VectorStore = VectorStore
-            self.retrieval_available = True
-        except ImportError as e:
-            print(f"⚠️  Retrieval not available: {e}")
-            self.retrieval_available = False
-        
         # Create temporary directory
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(prefix=f"akis_{os.getpid()}_")
         self.data_dir = Path(self.temp_dir)
     
     def tearDown(self):
         """Clean up"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _fast_rmtree(self.temp_dir)
     
     def test_knowledge_graph_creation(self):
         """Test knowledge graph initialization"""
-        if not self.retrieval_available:
-            self.skipTest("Retrieval not available")
-        
-        kg = self.KnowledgeGraph(str(self.data_dir))
+        kg = KnowledgeGraph(str(self.data_dir))
         self.assertIsNotNone(kg)
         
         # Check if database file was created
@@ -123,31 +157,16 @@ class TestAKISRetrieval(unittest.TestCase):
     
     def test_vector_store_creation(self):
         """Test vector store initialization"""
-        if not self.retrieval_available:
-            self.skipTest("Retrieval not available")
-        
-        vs = self.VectorStore(str(self.data_dir))
+        vs = VectorStore(str(self.data_dir))
         self.assertIsNotNone(vs)
 
 
+@unittest.skipUnless(_INGESTION_AVAILABLE, "Ingestion not available")
 class TestAKISIngestion(unittest.TestCase):
     """Test AKIS ingestion pipeline"""
     
-    def setUp(self):
-        """Set up test"""
-        try:
-            from akis.ingestion.pipeline import ToolManifestParser
-            self.ToolManifestParser = ToolManifestParser
-            self.ingestion_available = True
-        except ImportError as e:
-            print(f"⚠️  Ingestion not available: {e}")
-            self.ingestion_available = False
-    
     def test_manifest_parser(self):
         """Test tool manifest parsing"""
-        if not self.ingestion_available:
-            self.skipTest("Ingestion not available")
-        
         # Create sample manifest
         sample_manifest = {
             'id': 'test_tool',
@@ -163,7 +182,7 @@ class TestAKISIngestion(unittest.TestCase):
             }
         }
         
-        parser = self.ToolManifestParser()
+        parser = ToolManifestParser()
         
         # Test parsing
         try:
@@ -178,11 +197,11 @@ class TestAKISIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up integration test"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(prefix=f"akis_{os.getpid()}_")
         self.data_dir = Path(self.temp_dir)
         
         # Create sample manifest files
-        self.manifests_dir = self.data_dir / "manifests" / "tools"
+        self.manifests_dir = self.data_dir / _MANIFESTS_DIR_REL
         self.manifests_dir.mkdir(parents=True)
         
         # Sample tool manifest
@@ -201,25 +220,154 @@ class TestAKISIntegration(unittest.TestCase):
             'compliance_tags': ['content_creation', 'media_processing']
         }
         
-        manifest_file = self.manifests_dir / "video_creator.yml"
+        manifest_file = self.manifests_dir / _SAMPLE_MANIFEST
         with open(manifest_file, 'w') as f:
-            yaml.dump(sample_tool, f)
+            yaml.dump(sample_tool, f, Dumper=SafeDumper)
+        self._sample_tool = sample_tool
     
     def tearDown(self):
         """Clean up"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _fast_rmtree(self.temp_dir)
     
-    def test_manifest_files_exist(self):
-        """Test that manifest files are created"""
-        manifest_file = self.manifests_dir / "video_creator.yml"
-        self.assertTrue(manifest_file.exists())
+    def test_manifest_round_trip(self):
+        """Test that the manifest file is created and parses back to the same data"""
+        manifest_file = self.manifests_dir / _SAMPLE_MANIFEST
+        self.assertGreater(manifest_file.stat().st_size, 0)
         
-        # Test YAML loading
         with open(manifest_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
         
         self.assertEqual(data['id'], 'video_creator')
         self.assertEqual(data['name'], 'Video Creator')
+        self.assertEqual(data, self._sample_tool)
+
+
+@unittest.skipUnless(_INGESTION_AVAILABLE, "Ingestion not available")
+class TestAKISIncrementalIngest(unittest.TestCase):
+    """Test incremental ingest (IngestIndex) and the manifest cache across runs"""
+    
+    def setUp(self):
+        """Set up a manifest with two markdown documentation sources"""
+        self.temp_dir = tempfile.mkdtemp(prefix=f"akis_{os.getpid()}_")
+        self.data_dir = Path(self.temp_dir)
+        self.output_dir = self.data_dir / "data"
+        
+        docs_dir = self.data_dir / "docs"
+        docs_dir.mkdir()
+        self.guide = docs_dir / "guide.md"
+        self.guide.write_text("# Guide\n\nDeploy the pipeline with Docker and Python.\n")
+        self.notes = docs_dir / "notes.md"
+        self.notes.write_text("# Notes\n\nRetrieval uses embeddings and a knowledge graph.\n")
+        
+        self.manifests_dir = self.data_dir / _MANIFESTS_DIR_REL
+        self.manifests_dir.mkdir(parents=True)
+        manifest = {
+            'tool_id': 'doc_tool',
+            'name': 'Doc Tool',
+            'version': '1.0.0',
+            'vendor': 'AUTARK',
+            'capabilities': [],
+            'documentation_sources': [
+                {'type': 'markdown', 'path': str(self.guide)},
+                {'type': 'markdown', 'path': str(self.notes)}
+            ]
+        }
+        with open(self.manifests_dir / "doc_tool.yml", 'w') as f:
+            yaml.dump(manifest, f, Dumper=SafeDumper)
+    
+    def tearDown(self):
+        """Clean up"""
+        _fast_rmtree(self.temp_dir)
+    
+    def _run(self, output_dir=None, incremental=True, cache=None):
+        """Ingest the manifests and save; returns the pipeline"""
+        pipeline = IngestionPipeline(str(output_dir or self.output_dir), incremental=incremental)
+        pipeline.ingest_directory(str(self.manifests_dir), cache=cache)
+        pipeline.save_processed_data()
+        return pipeline
+    
+    def _documents_by_source(self, pipeline):
+        """Processed documents keyed by source path"""
+        return {doc.source_path: doc for doc in pipeline.processed_documents}
+    
+    def _saved(self, output_dir, name):
+        """Parsed JSON output file of a run"""
+        with open(Path(output_dir) / f"{name}.json") as f:
+            return json.load(f)
+    
+    def _saved_content(self, output_dir, name):
+        """Output file of a run without the per-run timestamps"""
+        return [{key: value for key, value in item.items() if not key.endswith('_at')}
+                for item in self._saved(output_dir, name)]
+    
+    def test_unchanged_source_reused(self):
+        """Test that an unchanged source is taken from the index instead of reprocessed"""
+        self._run()
+        pipeline = self._run()
+        
+        documents = self._documents_by_source(pipeline)
+        self.assertEqual(set(documents), {str(self.guide), str(self.notes)})
+        for doc in documents.values():
+            self.assertIs(doc, pipeline.ingest_index.documents[doc.document_id])
+    
+    def test_modified_source_reprocessed(self):
+        """Test that a modified source is read, chunked and indexed again"""
+        first = self._documents_by_source(self._run())
+        with open(self.guide, 'a') as f:
+            f.write("\nA new section about Kubernetes.\n")
+        
+        pipeline = self._run()
+        documents = self._documents_by_source(pipeline)
+        guide = documents[str(self.guide)]
+        self.assertIn("Kubernetes", guide.content)
+        self.assertNotEqual(guide.hash, first[str(self.guide)].hash)
+        self.assertNotIn(guide.document_id, pipeline.ingest_index.documents)
+        self.assertIs(documents[str(self.notes)],
+                      pipeline.ingest_index.documents[documents[str(self.notes)].document_id])
+        
+        # The next run reuses the reprocessed document
+        saved = {doc['source_path']: doc for doc in self._saved(self.output_dir, 'documents')}
+        self.assertEqual(saved[str(self.guide)]['hash'], guide.hash)
+        rerun = self._documents_by_source(self._run())
+        self.assertEqual(rerun[str(self.guide)].hash, guide.hash)
+    
+    def test_deleted_document(self):
+        """Test that a deleted source drops out of the output and the index"""
+        self._run()
+        self.guide.unlink()
+        
+        pipeline = self._run()
+        self.assertEqual(set(self._documents_by_source(pipeline)), {str(self.notes)})
+        saved = self._saved(self.output_dir, 'documents')
+        self.assertEqual([doc['source_path'] for doc in saved], [str(self.notes)])
+        with open(self.output_dir / ".ingest_index.json") as f:
+            index = json.load(f)
+        self.assertEqual(len(index), 1)
+        self.assertTrue(all(key.endswith(str(self.notes)) for key in index))
+    
+    def test_warm_cache_matches_cold(self):
+        """Test that a run from the manifest cache and ingest index matches a cold run"""
+        cold_dir = self.data_dir / "cold"
+        cache = ManifestCache(str(self.output_dir))
+        self._run(cache=cache)
+        cache.save()
+        
+        warm_cache = ManifestCache(str(self.output_dir))
+        manifest_file = self.manifests_dir / "doc_tool.yml"
+        self.assertIsNotNone(warm_cache.lookup(manifest_file))
+        self._run(cache=warm_cache)
+        self._run(output_dir=cold_dir, incremental=False)
+        
+        for name in ('tools', 'capabilities', 'concepts'):
+            self.assertEqual(self._saved_content(self.output_dir, name),
+                             self._saved_content(cold_dir, name), name)
+        
+        # Document and chunk ids are generated per processing run
+        def documents(output_dir):
+            return [(doc['source_path'], doc['content'], doc['hash'],
+                     [chunk['content'] for chunk in doc['chunks']])
+                    for doc in self._saved(output_dir, 'documents')]
+        self.assertEqual(documents(self.output_dir), documents(cold_dir))
 
 
 class TestAKISSystem(unittest.TestCase):
@@ -227,12 +375,12 @@ class TestAKISSystem(unittest.TestCase):
     
     def setUp(self):
         """Set up system test"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(prefix=f"akis_{os.getpid()}_")
         self.data_dir = Path(self.temp_dir)
     
     def tearDown(self):
         """Clean up"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _fast_rmtree(self.temp_dir)
     
     def test_system_components(self):
         """Test that all AKIS components can be imported"""
@@ -247,11 +395,11 @@ class TestAKISSystem(unittest.TestCase):
         missing_components = []
         
         for component in components:
-            try:
-                __import__(component)
+            error = _find_component(component)
+            if error is None:
                 available_components.append(component)
-            except ImportError as e:
-                missing_components.append((component, str(e)))
+            else:
+                missing_components.append((component, error))
         
         print(f"\n✅ Available components: {len(available_components)}")
         for comp in available_components:
@@ -266,54 +414,91 @@ class TestAKISSystem(unittest.TestCase):
         self.assertIn('akis.ontology.models', available_components)
 
 
-def run_akis_tests():
-    """Run all AKIS tests"""
+# One shared loader; test methods keep their dir() order
+_LOADER = unittest.TestLoader()
+_LOADER.sortTestMethodsUsing = None
+
+_MODULE_CLASSES = {
+    'models': TestAKISModels,
+    'retrieval': TestAKISRetrieval,
+    'ingestion': TestAKISIngestion,
+    'integration': TestAKISIntegration,
+    'incremental': TestAKISIncrementalIngest,
+    'system': TestAKISSystem
+}
+
+
+def _run_test_class(class_name):
+    """Run one TestCase class and return a picklable summary (process pool worker)"""
+    stream = io.StringIO()
+    suite = _LOADER.loadTestsFromTestCase(globals()[class_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return {
+        'output': stream.getvalue(),
+        'tests_run': result.testsRun,
+        'failures': [(str(test), tb) for test, tb in result.failures],
+        'errors': [(str(test), tb) for test, tb in result.errors],
+        'skipped': len(result.skipped)
+    }
+
+
+def _last_line(traceback):
+    """Last non-empty line of a traceback (the exception message)"""
+    lines = traceback.strip().split('\n') if traceback else []
+    return lines[-1] if lines else 'Unknown'
+
+
+def run_akis_tests(parallel=False):
+    """Run all AKIS tests (parallel: one process per TestCase class)"""
     
     print("="*60)
     print("🧪 AUTARK Knowledge Integration System")
     print("🔬 Test Suite")
     print("="*60)
     
-    # Create test suite
-    suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_classes = [
-        TestAKISModels,
-        TestAKISRetrieval,
-        TestAKISIngestion, 
-        TestAKISIntegration,
-        TestAKISSystem
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    suite = _LOADER.loadTestsFromModule(sys.modules[__name__])
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    if parallel:
+        # loadTestsFromModule yields one sub-suite per TestCase class
+        class_names = [type(next(iter(group))).__name__ for group in suite if group.countTestCases()]
+        workers = min(len(class_names), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_run_test_class, class_names))
+        for outcome in outcomes:
+            sys.stderr.write(outcome['output'])
+        tests_run = sum(o['tests_run'] for o in outcomes)
+        failures = [item for o in outcomes for item in o['failures']]
+        errors = [item for o in outcomes for item in o['errors']]
+        skipped = sum(o['skipped'] for o in outcomes)
+    else:
+        # Run tests
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        tests_run = result.testsRun
+        failures = result.failures
+        errors = result.errors
+        skipped = len(result.skipped)
     
     # Summary
     print("\n" + "="*60)
     print("📊 Test Results Summary")
     print("="*60)
-    print(f"Tests Run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
+    print(f"Tests Run: {tests_run}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
+    print(f"Skipped: {skipped}")
     
-    if result.failures:
+    if failures:
         print("\n❌ Failures:")
-        for test, traceback in result.failures:
-            print(f"   - {test}: {traceback.split('\\n')[-2] if traceback else 'Unknown'}")
+        for test, traceback in failures:
+            print(f"   - {test}: {_last_line(traceback)}")
     
-    if result.errors:
+    if errors:
         print("\n💥 Errors:")
-        for test, traceback in result.errors:
-            print(f"   - {test}: {traceback.split('\\n')[-2] if traceback else 'Unknown'}")
+        for test, traceback in errors:
+            print(f"   - {test}: {_last_line(traceback)}")
     
-    success_rate = ((result.testsRun - len(result.failures) - len(result.errors)) / max(1, result.testsRun)) * 100
+    success_rate = ((tests_run - len(failures) - len(errors)) / max(1, tests_run)) * 100
     print(f"\n🎯 Success Rate: {success_rate:.1f}%")
     
     if success_rate >= 80:
@@ -323,7 +508,7 @@ def run_akis_tests():
     else:
         print("❌ AKIS System: NEEDS ATTENTION")
     
-    return result.wasSuccessful()
+    return not failures and not errors
 
 
 def main():
@@ -333,7 +518,7 @@ def main():
     parser = argparse.ArgumentParser(description="AKIS Test Suite")
     parser.add_argument(
         "--module",
-        choices=['models', 'retrieval', 'ingestion', 'integration', 'system', 'all'],
+        choices=[*_MODULE_CLASSES, 'all'],
         default='all',
         help="Test specific module"
     )
@@ -342,25 +527,20 @@ def main():
         action="store_true",
         help="Verbose output"
     )
+    parser.add_argument(
+        "--parallel", "-j",
+        action="store_true",
+        help="Run each test class in its own process"
+    )
     
     args = parser.parse_args()
     
     if args.module == 'all':
-        success = run_akis_tests()
+        success = run_akis_tests(parallel=args.parallel)
     else:
         # Run specific module tests
         print(f"🔬 Testing {args.module} module...")
-        
-        if args.module == 'models':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestAKISModels)
-        elif args.module == 'retrieval':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestAKISRetrieval)
-        elif args.module == 'ingestion':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestAKISIngestion)
-        elif args.module == 'integration':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestAKISIntegration)
-        elif args.module == 'system':
-            suite = unittest.TestLoader().loadTestsFromTestCase(TestAKISSystem)
+        suite = _LOADER.loadTestsFromTestCase(_MODULE_CLASSES[args.module])
         
         runner = unittest.TextTestRunner(verbosity=2 if args.verbose else 1)
         result = runner.run(suite)
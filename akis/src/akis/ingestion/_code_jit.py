@@ -0,0 +1,90 @@
+"""
+AKIS Code-Split-Kernels
+=======================
+
+numba-Kernels für `pipeline._split_code`: Zeilengrenzen und Schnittpunkte
+direkt auf dem UTF-8-Puffer. Wird erst beim ersten Code-Split importiert,
+damit `import akis` numba nicht lädt; ohne numpy/numba schlägt der Import
+fehl und die Pipeline nutzt den Python-Pfad.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _is_space(b):
+    # ASCII-Anteil von str.isspace(): \t-\r, \x1c-\x1f, Leerzeichen
+    return (9 <= b <= 13) or (28 <= b <= 32)
+
+
+@njit(cache=True)
+def _starts_with(buf, pos, end, word):
+    if end - pos < len(word):
+        return False
+    for j in range(len(word)):
+        if buf[pos + j] != word[j]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def code_line_ends(buf):
+    """Zeilenenden (Position des \\n bzw. len) und Art je Zeile:
+    0 = normal, 1 = def/class, 2 = unklar wegen Nicht-ASCII (Entscheidung in Python)"""
+    n = len(buf)
+    n_lines = 1
+    for i in range(n):
+        if buf[i] == 10:
+            n_lines += 1
+    ends = np.empty(n_lines, dtype=np.int64)
+    kinds = np.zeros(n_lines, dtype=np.int8)
+    def_word = np.array([100, 101, 102, 32], dtype=np.uint8)
+    class_word = np.array([99, 108, 97, 115, 115, 32], dtype=np.uint8)
+
+    line = 0
+    start = 0
+    for i in range(n + 1):
+        if i < n and buf[i] != 10:
+            continue
+        ends[line] = i
+        lo = start
+        while lo < i and _is_space(buf[lo]):
+            lo += 1
+        if lo < i and buf[lo] >= 128:
+            # Möglicher Unicode-Whitespace am Zeilenanfang
+            kinds[line] = 2
+        else:
+            width = 0
+            if _starts_with(buf, lo, i, def_word):
+                width = 4
+            elif _starts_with(buf, lo, i, class_word):
+                width = 6
+            # Treffer nur, wenn nach dem Schlüsselwort noch Nicht-Whitespace folgt
+            for j in range(lo + width, i if width else lo):
+                if buf[j] >= 128:
+                    kinds[line] = 2
+                elif not _is_space(buf[j]):
+                    kinds[line] = 1
+                    break
+        line += 1
+        start = i + 1
+    return ends, kinds
+
+
+@njit(cache=True)
+def code_cuts(kinds, max_lines):
+    """Index der letzten Zeile je Chunk"""
+    cuts = np.empty(len(kinds), dtype=np.int64)
+    n_cuts = 0
+    count = 0
+    for i in range(len(kinds)):
+        count += 1
+        if kinds[i] == 1 or count >= max_lines:
+            cuts[n_cuts] = i
+            n_cuts += 1
+            count = 0
+    if count:
+        cuts[n_cuts] = len(kinds) - 1
+        n_cuts += 1
+    return cuts[:n_cuts]
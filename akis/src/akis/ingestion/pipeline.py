@@ -8,43 +8,253 @@ in die AKIS Knowledge Base mit Lernkurven-Integration.
 
 import json
 import yaml
+import datetime
+import functools
 import hashlib
 import logging
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import asdict
+from collections import Counter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from concurrent.futures import Executor, Future
+from dataclasses import fields, is_dataclass
+from enum import Enum
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ..ontology.models import (
     Tool, Capability, Document, DocumentChunk, Concept, 
-    MaturityProfile, BenchmarkCase, generate_id,
+    MaturityProfile, BenchmarkCase, generate_id, generate_ids,
     MaturityLevel, RiskLevel, ComplianceTag
 )
 
 logger = logging.getLogger(__name__)
 
+# usedforsecurity gibt es erst ab Python 3.9
+_SHA256_OPTIONS = {'usedforsecurity': False} if sys.version_info >= (3, 9) else {}
+
+# Ab dieser Länge wird Text chunkweise statt per content.split() zerlegt
+_STREAM_SPLIT_MIN_CHARS = 1 << 20
+
+# Max Zeilen pro Code-Chunk
+_CODE_CHUNK_MAX_LINES = 50
+
+
+def _to_plain(obj: Any) -> Any:
+    """Dataclasses/Enums zu JSON-Grundtypen wie orjson sie abbildet (ohne Deepcopy)
+    
+    Wie bei orjson bleiben Felder mit führendem Unterstrich (interne Caches) außen vor.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_plain(value) for key, value in obj.items()}
+    if np is not None and isinstance(obj, np.ndarray):
+        # Kürzeste Darstellung je Element wie orjson (float32 nicht als float64-Ziffern)
+        return [float(str(value)) for value in obj.ravel()] if obj.dtype == np.float32 else obj.tolist()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: _to_plain(getattr(obj, f.name)) for f in fields(obj)
+                if not f.name.startswith('_')}
+    return obj
+
+
+def _write_json(path: Path, items: List[Any]) -> None:
+    """Schreibe Objektliste eingerückt als JSON; orjson serialisiert Dataclasses direkt"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            items, default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_SERIALIZE_NUMPY)
+        ))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(_to_plain(items), f, indent=2, ensure_ascii=False, default=str)
+
+
+# Dateiendungen von Tool-Manifesten; .json wird ohne YAML-Parser gelesen
+MANIFEST_SUFFIXES = ('.yml', '.yaml', '.json')
+
+
+@functools.lru_cache(maxsize=512)
+def _parsed_manifest(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Geparstes Manifest je (Pfad, mtime_ns, Größe); Ergebnis wird geteilt, nicht mutieren"""
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _sha256_hex(data: bytes) -> str:
+    """sha256-Hexdigest als Fingerprint (nicht sicherheitsrelevant)"""
+    return hashlib.sha256(data, **_SHA256_OPTIONS).hexdigest()
+
+
+def _split_text(content: str, chunk_size: int) -> List[Tuple[str, str]]:
+    """Zerlege Text in Chunks zu je `chunk_size` Wörtern als (Text, sha256)"""
+    if len(content) >= _STREAM_SPLIT_MIN_CHARS:
+        # Große Dokumente: immer nur die Wörter eines Chunks als Objekte halten
+        chunk_texts = (' '.join(m.group().split()) for m in _chunk_regex(chunk_size).finditer(content))
+    else:
+        words = content.split()
+        chunk_texts = (' '.join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size))
+    
+    return [(chunk_text, _sha256_hex(chunk_text.encode('utf-8'))) for chunk_text in chunk_texts]
+
+
+@functools.lru_cache(maxsize=8)
+def _chunk_regex(chunk_size: int):
+    """Regex für bis zu `chunk_size` aufeinanderfolgende Wörter (\\s wie str.split())"""
+    return re.compile(r'\S+(?:\s+\S+){0,%d}' % (chunk_size - 1))
+
+
+def _split_code(content: str) -> List[Tuple[str, str]]:
+    """Zerlege Code an Funktions-/Klassen-Definitionen als (Text, sha256)"""
+    kernels = _code_kernels()
+    if kernels is not None:
+        return _split_code_jit(content, *kernels)
+    
+    # Vereinfachte Implementation - könnte erweitert werden für AST-basierte Chunking
+    # Chunks werden per Offset aus content geschnitten statt aus Zeilen zusammengefügt
+    pieces = []
+    chunk_start = line_end = 0
+    line_count = 0
+    
+    for line in content.split('\n'):
+        line_end += len(line)
+        line_count += 1
+        
+        # Neue Chunk bei Funktions-/Klassen-Definitionen
+        if (line_count >= _CODE_CHUNK_MAX_LINES or
+            line.strip().startswith(('def ', 'class '))):
+            
+            chunk_text = content[chunk_start:line_end]
+            pieces.append((chunk_text, _sha256_hex(chunk_text.encode('utf-8'))))
+            chunk_start = line_end + 1
+            line_count = 0
+        
+        line_end += 1
+    
+    # Letzter Chunk
+    if line_count:
+        chunk_text = content[chunk_start:]
+        pieces.append((chunk_text, _sha256_hex(chunk_text.encode('utf-8'))))
+    
+    return pieces
+
+
+def _split_code_jit(content: str, code_line_ends, code_cuts) -> List[Tuple[str, str]]:
+    """numba-Pfad von _split_code: Zeilengrenzen und Schnitte auf dem UTF-8-Puffer"""
+    data = content.encode('utf-8')
+    line_ends, kinds = code_line_ends(np.frombuffer(data, dtype=np.uint8))
+    ends = line_ends.tolist()
+    
+    # Unklare Zeilen (Nicht-ASCII am Rand) entscheidet str.strip() wie im Python-Pfad
+    for i in np.flatnonzero(kinds == 2).tolist():
+        start = ends[i - 1] + 1 if i else 0
+        stripped = data[start:ends[i]].decode('utf-8').strip()
+        kinds[i] = stripped.startswith('def ') or stripped.startswith('class ')
+    
+    pieces = []
+    start = 0
+    for last in code_cuts(kinds, _CODE_CHUNK_MAX_LINES).tolist():
+        chunk = data[start:ends[last]]
+        pieces.append((chunk.decode('utf-8'), _sha256_hex(chunk)))
+        start = ends[last] + 1
+    
+    return pieces
+
+
+@functools.lru_cache(maxsize=None)
+def _code_kernels():
+    """JIT-Kernels (code_line_ends, code_cuts) für _split_code oder None ohne numba/numpy
+    
+    Das Kernel-Modul (und damit numba) wird erst beim ersten Code-Split geladen.
+    """
+    try:
+        from ._code_jit import code_line_ends, code_cuts
+    except ImportError:
+        return None
+    return code_line_ends, code_cuts
+
+
+def _decode_source(data: bytes) -> Tuple[str, str]:
+    """Text und sha256 einer Quelldatei aus ihren Bytes"""
+    if b'\r' in data:
+        # Zeilenenden wie read_text() normalisieren; Hash über den normalisierten Text
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        return content, _sha256_hex(content.encode('utf-8'))
+    return data.decode('utf-8'), _sha256_hex(data)
+
+
+@functools.lru_cache(maxsize=256)
+def _processed_source(path: str, mtime_ns: int, size: int,
+                      code: bool, chunk_size: int) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    """Inhalt, sha256 und Chunk-Stücke einer Quelldatei je (Pfad, mtime_ns, Größe)"""
+    content, doc_hash = _decode_source(Path(path).read_bytes())
+    pieces = _split_code(content) if code else _split_text(content, chunk_size)
+    return content, doc_hash, tuple(pieces)
+
 
 class ToolManifestParser:
     """Parser für Tool-Manifeste"""
     
+    # Wert -> Enum-Member, einmal bei Klassendefinition aufgebaut
+    _COMPLIANCE_BY_VALUE = {tag.value: tag for tag in ComplianceTag}
+    _RISK_BY_VALUE = {level.value: level for level in RiskLevel}
+    
+    @staticmethod
+    def _lookup(table: Dict[Any, Any], value: Any) -> Any:
+        """Enum-Member zu einem Manifest-Wert oder None (auch für unhashbare YAML-Werte)"""
+        try:
+            return table.get(value)
+        except TypeError:
+            return None
+    
+    def load(self, manifest_path: str, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Lese Tool-Manifest (JSON direkt, YAML mit libyaml-Loader falls verfügbar; gecacht je mtime/Größe)"""
+        if st is None:
+            st = os.stat(manifest_path)
+        return _parsed_manifest(os.path.abspath(manifest_path), st.st_mtime_ns, st.st_size)
+    
     def parse_manifest(self, manifest_path: str) -> Tool:
-        """Parse Tool-Manifest YAML zu Tool-Objekt"""
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
+        """Parse Tool-Manifest (YAML oder JSON) zu Tool-Objekt"""
+        return self.tool_from_data(self.load(manifest_path))
+    
+    def tool_from_data(self, data: Dict[str, Any]) -> Tool:
+        """Erzeuge Tool-Objekt aus bereits geladenem Manifest"""
         # Konvertiere Compliance Tags
         compliance_tags = []
         for tag_str in data.get('compliance_tags', []):
-            try:
-                compliance_tags.append(ComplianceTag(tag_str))
-            except ValueError:
+            tag = self._lookup(self._COMPLIANCE_BY_VALUE, tag_str)
+            if tag is None:
                 logger.warning(f"Unknown compliance tag: {tag_str}")
+            else:
+                compliance_tags.append(tag)
         
         # Konvertiere Risk Level
-        risk_level = RiskLevel.MEDIUM
-        try:
-            risk_level = RiskLevel(data.get('risk_level', 'medium'))
-        except ValueError:
+        risk_level = self._lookup(self._RISK_BY_VALUE, data.get('risk_level', 'medium'))
+        if risk_level is None:
             logger.warning(f"Unknown risk level: {data.get('risk_level')}")
+            risk_level = RiskLevel.MEDIUM
         
         # Erstelle Tool
         tool = Tool(
@@ -64,9 +274,10 @@ class ToolManifestParser:
     
     def parse_capabilities(self, manifest_path: str) -> List[Capability]:
         """Parse Capabilities aus Tool-Manifest"""
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
+        return self.capabilities_from_data(self.load(manifest_path))
+    
+    def capabilities_from_data(self, data: Dict[str, Any]) -> List[Capability]:
+        """Erzeuge Capabilities aus bereits geladenem Manifest"""
         capabilities = []
         for cap_data in data.get('capabilities', []):
             
@@ -145,19 +356,216 @@ class ToolManifestParser:
         )
 
 
+class ManifestCache:
+    """Cache geladener Manifeste über Re-Init-Läufe hinweg
+    
+    Der Index (`.manifest_cache.json`) hält je Manifest mtime_ns, Größe und
+    sha256; die geladenen Daten liegen als JSON unter `.manifest_cache/<sha256>.json`.
+    Stimmen mtime_ns und Größe, genügt ein stat; sonst entscheidet der Hash.
+    """
+    
+    def __init__(self, data_dir: str):
+        self.index_file = Path(data_dir) / ".manifest_cache.json"
+        self.blob_dir = Path(data_dir) / ".manifest_cache"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.index_file.exists():
+            try:
+                self.entries = json.loads(self.index_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable manifest cache {self.index_file}: {e}")
+    
+    def lookup(self, manifest_path: Path,
+               st: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """Geladenes Manifest aus dem Cache oder None, falls veraltet/unbekannt"""
+        key = str(Path(manifest_path).resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        if st is None:
+            st = os.stat(key)
+        if (st.st_mtime_ns, st.st_size) != (entry['mtime_ns'], entry['size']):
+            if _sha256_hex(Path(key).read_bytes()) != entry['sha256']:
+                return None
+            entry['mtime_ns'], entry['size'] = st.st_mtime_ns, st.st_size
+        
+        try:
+            with open(self.blob_dir / f"{entry['sha256']}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def store(self, manifest_path: Path, data: Dict[str, Any],
+              st: Optional[os.stat_result] = None) -> None:
+        """Lege geladenes Manifest im Cache ab"""
+        key = str(Path(manifest_path).resolve())
+        if st is None:
+            st = os.stat(key)
+        sha256 = _sha256_hex(Path(key).read_bytes())
+        
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.blob_dir / f"{sha256}.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        self.entries[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': sha256}
+    
+    def save(self) -> None:
+        """Entferne Einträge gelöschter Manifeste und schreibe den Index"""
+        self.entries = {key: entry for key, entry in self.entries.items() if os.path.exists(key)}
+        live = {entry['sha256'] for entry in self.entries.values()}
+        if self.blob_dir.exists():
+            for blob in self.blob_dir.glob("*.json"):
+                if blob.stem not in live:
+                    blob.unlink()
+        
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Zeitstempel aus dem JSON-Export (str(datetime)) zurück in datetime"""
+    return datetime.datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _chunk_from_plain(data: Dict[str, Any]) -> DocumentChunk:
+    """DocumentChunk aus seiner Form in `documents.json`"""
+    # Nur bekannte Felder übernehmen (ältere Exporte enthalten noch `embedding`)
+    chunk_fields = DocumentChunk.__dataclass_fields__
+    data = {key: value for key, value in data.items() if key in chunk_fields}
+    data['created_at'] = _parse_datetime(data.get('created_at'))
+    return DocumentChunk(**data)
+
+
+def _document_from_plain(data: Dict[str, Any]) -> Document:
+    """Document samt Chunks aus seiner Form in `documents.json`"""
+    data = dict(data)
+    data['chunks'] = [_chunk_from_plain(chunk) for chunk in data.get('chunks', [])]
+    data['compliance_classification'] = [
+        ComplianceTag(tag) for tag in data.get('compliance_classification', [])
+    ]
+    data['created_at'] = _parse_datetime(data.get('created_at'))
+    data['updated_at'] = _parse_datetime(data.get('updated_at'))
+    return Document(**data)
+
+
+def _concept_from_plain(data: Dict[str, Any]) -> Concept:
+    """Concept aus seiner Form in `concepts.json`"""
+    return Concept(**{**data, 'created_at': _parse_datetime(data.get('created_at'))})
+
+
+def _ingest_key(source_path: str, source_type: str, tool_refs: List[str]) -> str:
+    """Schlüssel einer Dokumentquelle im IngestIndex"""
+    return '|'.join((source_type, ','.join(tool_refs), os.path.abspath(source_path)))
+
+
+def _source_unchanged(source_path: str, entry: Dict[str, Any]) -> bool:
+    """Prüfe Quelle gegen ihren Index-Eintrag: stat genügt, sonst entscheidet der Hash"""
+    try:
+        st = os.stat(source_path)
+        if (st.st_mtime_ns, st.st_size) == (entry['mtime_ns'], entry['size']):
+            return True
+        return _decode_source(Path(source_path).read_bytes())[1] == entry['doc_hash']
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+class IngestIndex:
+    """Index der zuletzt gespeicherten Dokumente für inkrementelles Ingest
+    
+    `.ingest_index.json` im Output-Verzeichnis hält je Dokumentquelle (Typ,
+    Tool-Refs, Pfad) mtime_ns, Größe, doc_hash, Chunk-Größe, document_id und
+    die extrahierten concept_ids. Unveränderte Quellen werden nicht erneut
+    gelesen; Document und Concepts kommen aus `documents.json`/`concepts.json`
+    des letzten Laufs.
+    """
+    
+    def __init__(self, output_dir: str):
+        self.index_file = Path(output_dir) / ".ingest_index.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.documents: Dict[str, Document] = {}
+        self.concepts: Dict[str, Concept] = {}
+        if not self.index_file.exists():
+            return
+        
+        try:
+            entries = json.loads(self.index_file.read_text(encoding='utf-8'))
+            with open(self.index_file.parent / "documents.json", 'r', encoding='utf-8') as f:
+                documents = {doc['document_id']: doc for doc in json.load(f)}
+            with open(self.index_file.parent / "concepts.json", 'r', encoding='utf-8') as f:
+                concepts = {concept['concept_id']: concept for concept in json.load(f)}
+            
+            # Nur Einträge, deren Document und Concepts noch vorliegen
+            for key, entry in entries.items():
+                document = documents.get(entry['document_id'])
+                if document is None or not all(cid in concepts for cid in entry['concept_ids']):
+                    continue
+                self.entries[key] = entry
+                self.documents[entry['document_id']] = _document_from_plain(document)
+                for cid in entry['concept_ids']:
+                    if cid not in self.concepts:
+                        self.concepts[cid] = _concept_from_plain(concepts[cid])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unusable ingest index {self.index_file}: {e}")
+            self.entries, self.documents, self.concepts = {}, {}, {}
+    
+    def save(self, documents: List[Document], document_concepts: Dict[str, List[str]],
+             chunk_size: int) -> None:
+        """Schreibe den Index für die gespeicherten Dokumente"""
+        entries: Dict[str, Dict[str, Any]] = {}
+        duplicates = set()
+        for doc in documents:
+            key = _ingest_key(doc.source_path, doc.source_type, doc.tool_refs)
+            if key in entries:
+                # Mehrfach referenzierte Quellen werden immer neu verarbeitet
+                duplicates.add(key)
+                continue
+            
+            try:
+                st = os.stat(doc.source_path)
+                previous = self.entries.get(key)
+                if (previous is None or previous['document_id'] != doc.document_id
+                        or (st.st_mtime_ns, st.st_size) != (previous['mtime_ns'], previous['size'])):
+                    # Nur Quellen indexieren, die noch dem verarbeiteten Stand entsprechen
+                    if _decode_source(Path(doc.source_path).read_bytes())[1] != doc.hash:
+                        continue
+            except (OSError, UnicodeDecodeError):
+                continue
+            
+            entries[key] = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'doc_hash': doc.hash,
+                'chunk_size': chunk_size,
+                'document_id': doc.document_id,
+                'concept_ids': document_concepts.get(doc.document_id, [])
+            }
+        
+        for key in duplicates:
+            entries.pop(key, None)
+        
+        self.entries = entries
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+
+
 class DocumentProcessor:
     """Verarbeitung von Dokumenten zu Knowledge Units"""
     
     def __init__(self, chunk_size: int = 1000):
         self.chunk_size = chunk_size
     
+    def _load_source(self, path: Path, code: bool) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        """Inhalt, Hash und Chunk-Stücke; unveränderte Dateien kommen aus dem Cache"""
+        st = path.stat()
+        return _processed_source(os.path.abspath(path), st.st_mtime_ns, st.st_size,
+                                 code, self.chunk_size)
+    
     def process_markdown(self, file_path: str, tool_refs: List[str] = None) -> Document:
         """Verarbeite Markdown-Dokument"""
         path = Path(file_path)
-        content = path.read_text(encoding='utf-8')
+        content, doc_hash, pieces = self._load_source(path, code=False)
         
         # Erstelle Dokument
-        doc_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
         doc = Document(
             document_id=generate_id(),
             source_path=str(path),
@@ -169,7 +577,7 @@ class DocumentProcessor:
         )
         
         # Erstelle Chunks
-        chunks = self._create_chunks(content, doc.document_id, tool_refs or [])
+        chunks = self._build_chunks(pieces, doc.document_id, tool_refs or [])
         doc.chunks = chunks
         
         return doc
@@ -177,9 +585,8 @@ class DocumentProcessor:
     def process_code(self, file_path: str, tool_refs: List[str] = None) -> Document:
         """Verarbeite Code-Datei"""
         path = Path(file_path)
-        content = path.read_text(encoding='utf-8')
+        content, doc_hash, pieces = self._load_source(path, code=True)
         
-        doc_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
         doc = Document(
             document_id=generate_id(),
             source_path=str(path),
@@ -192,92 +599,58 @@ class DocumentProcessor:
         )
         
         # Code-spezifische Chunking
-        chunks = self._create_code_chunks(content, doc.document_id, tool_refs or [])
+        chunks = self._build_chunks(pieces, doc.document_id, tool_refs or [], code=True)
         doc.chunks = chunks
         
         return doc
     
     def _extract_title(self, content: str) -> str:
         """Extrahiere Titel aus Markdown"""
-        lines = content.split('\n')
-        for line in lines[:5]:  # Schaue nur erste 5 Zeilen
-            if line.startswith('# '):
-                return line[2:].strip()
+        # Schaue nur erste 5 Zeilen; Zeilengrenzen per find statt split des ganzen Dokuments
+        start = 0
+        for _ in range(5):
+            end = content.find('\n', start)
+            if content.startswith('# ', start):
+                return content[start + 2:end if end >= 0 else len(content)].strip()
+            if end < 0:
+                break
+            start = end + 1
         return "Untitled Document"
     
-    def _create_chunks(self, content: str, doc_id: str, tool_refs: List[str]) -> List[DocumentChunk]:
-        """Erstelle Text-Chunks"""
+    def _build_chunks(self, pieces, doc_id: str, tool_refs: List[str],
+                      code: bool = False) -> List[DocumentChunk]:
+        """Erzeuge DocumentChunks aus (Text, sha256)-Stücken"""
         chunks = []
-        words = content.split()
-        
-        for i in range(0, len(words), self.chunk_size):
-            chunk_words = words[i:i + self.chunk_size]
-            chunk_text = ' '.join(chunk_words)
-            
-            chunk_hash = hashlib.sha256(chunk_text.encode('utf-8')).hexdigest()
-            
+        chunk_ids = generate_ids(len(pieces))
+        # Ein Zeitstempel (ein datetime-Objekt) für alle Chunks des Dokuments
+        created_at = datetime.datetime.now()
+        for chunk_index, (chunk_text, chunk_hash) in enumerate(pieces):
             chunk = DocumentChunk(
-                chunk_id=generate_id(),
+                chunk_id=chunk_ids[chunk_index],
                 document_id=doc_id,
                 content=chunk_text,
-                chunk_index=i // self.chunk_size,
+                chunk_index=chunk_index,
                 tool_refs=tool_refs,
-                hash=chunk_hash
+                hash=chunk_hash,
+                created_at=created_at
             )
+            if code:
+                chunk.metadata = {'type': 'code_block'}
             chunks.append(chunk)
         
         return chunks
     
+    def _create_chunks(self, content: str, doc_id: str, tool_refs: List[str]) -> List[DocumentChunk]:
+        """Erstelle Text-Chunks"""
+        return self._build_chunks(_split_text(content, self.chunk_size), doc_id, tool_refs)
+    
     def _create_code_chunks(self, content: str, doc_id: str, tool_refs: List[str]) -> List[DocumentChunk]:
         """Erstelle Code-spezifische Chunks (z.B. nach Funktionen)"""
-        # Vereinfachte Implementation - könnte erweitert werden für AST-basierte Chunking
-        lines = content.split('\n')
-        chunks = []
-        current_chunk = []
-        chunk_index = 0
-        
-        for line in lines:
-            current_chunk.append(line)
-            
-            # Neue Chunk bei Funktions-/Klassen-Definitionen
-            if (line.strip().startswith('def ') or 
-                line.strip().startswith('class ') or
-                len(current_chunk) >= 50):  # Max 50 Zeilen pro Chunk
-                
-                chunk_text = '\n'.join(current_chunk)
-                chunk_hash = hashlib.sha256(chunk_text.encode('utf-8')).hexdigest()
-                
-                chunk = DocumentChunk(
-                    chunk_id=generate_id(),
-                    document_id=doc_id,
-                    content=chunk_text,
-                    chunk_index=chunk_index,
-                    tool_refs=tool_refs,
-                    hash=chunk_hash,
-                    metadata={'type': 'code_block'}
-                )
-                chunks.append(chunk)
-                
-                current_chunk = []
-                chunk_index += 1
-        
-        # Letzter Chunk
-        if current_chunk:
-            chunk_text = '\n'.join(current_chunk)
-            chunk_hash = hashlib.sha256(chunk_text.encode('utf-8')).hexdigest()
-            
-            chunk = DocumentChunk(
-                chunk_id=generate_id(),
-                document_id=doc_id,
-                content=chunk_text,
-                chunk_index=chunk_index,
-                tool_refs=tool_refs,
-                hash=chunk_hash,
-                metadata={'type': 'code_block'}
-            )
-            chunks.append(chunk)
-        
-        return chunks
+        return self._build_chunks(_split_code(content), doc_id, tool_refs, code=True)
+
+
+# Nicht-ASCII-Zeichen, deren str.lower() ASCII-Zeichen enthält (U+0130 -> "i̇", U+212A -> "k")
+_ASCII_LOWERING = ('\u0130', '\u212a')
 
 
 class ConceptExtractor:
@@ -291,31 +664,152 @@ class ConceptExtractor:
             'ai_video': ['generation', 'synthesis', 'rendering', 'effects', 'animation'],
             'data': ['processing', 'analytics', 'pipeline', 'transformation', 'storage']
         }
+        # Flache Term-Tabelle mit vorberechneten Feldern; Reihenfolge wie concept_patterns
+        self._term_table = tuple(
+            (term, category, f"{category}_{term}", term.title(),
+             f"Concept: {term} in category {category}", f"{category}.{term}")
+            for category, terms in self.concept_patterns.items()
+            for term in terms
+        )
+        # Reine ASCII-Terme lassen sich im UTF-8-Puffer suchen (siehe extract_concepts)
+        terms = {row[0] for row in self._term_table}
+        self._term_bytes = (
+            {term: term.encode('ascii') for term in terms}
+            if all(term.isascii() for term in terms) else None
+        )
     
     def extract_concepts(self, text: str) -> List[Concept]:
         """Extrahiere Concepts aus Text"""
         concepts = []
-        text_lower = text.lower()
-        
-        for category, terms in self.concept_patterns.items():
-            for term in terms:
-                if term in text_lower:
-                    concept = Concept(
-                        concept_id=f"{category}_{term}",
-                        name=term.title(),
-                        description=f"Concept: {term} in category {category}",
-                        taxonomy_path=f"{category}.{term}",
-                        domain_tags=[category]
-                    )
-                    concepts.append(concept)
+        
+        # Bei ASCII-Termen genügt bytes.lower() auf dem kompakten UTF-8-Puffer
+        # statt str.lower() (bei Emojis o.ä. 4 Byte je Zeichen); nur İ und das
+        # Kelvin-Zeichen ergeben per str.lower() ASCII und erzwingen den str-Pfad
+        term_bytes = self._term_bytes
+        if term_bytes is not None and (text.isascii() or not any(ch in text for ch in _ASCII_LOWERING)):
+            text_lower = text.encode('utf-8').lower()
+        else:
+            term_bytes = None
+            text_lower = text.lower()
+        
+        # str/bytes.__contains__ (Two-Way-Suche in C) schlägt bei diesen
+        # Termmengen eine re-Alternation; jeder Term wird nur einmal gesucht
+        hits: Dict[str, bool] = {}
+        for term, category, concept_id, name, description, taxonomy_path in self._term_table:
+            found = hits.get(term)
+            if found is None:
+                needle = term_bytes[term] if term_bytes is not None else term
+                found = hits[term] = needle in text_lower
+            if found:
+                concepts.append(Concept(
+                    concept_id=concept_id,
+                    name=name,
+                    description=description,
+                    taxonomy_path=taxonomy_path,
+                    domain_tags=[category]
+                ))
         
         return concepts
 
 
+def _process_documentation(tool: Tool, doc_processor: DocumentProcessor,
+                           concept_extractor: ConceptExtractor,
+                           index_entries: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Verarbeite die Dokumentationsquellen eines Tools samt Concepts
+    
+    Liefert die Dokumente und je Dokument dessen Concepts. Unveränderte Quellen
+    aus `index_entries` (IngestIndex) stehen dort nur als document_id bzw.
+    concept_ids; die Pipeline setzt die Objekte des letzten Laufs ein.
+    """
+    documents = []
+    document_concepts = []
+    for doc_source in tool.documentation_sources:
+        source_type = doc_source.get('type')
+        if source_type == 'markdown':
+            process = doc_processor.process_markdown
+        elif source_type == 'code':
+            process = doc_processor.process_code
+        else:
+            continue
+        
+        source_path = doc_source.get('path', '')
+        if index_entries:
+            entry = index_entries.get(_ingest_key(source_path, source_type, [tool.tool_id]))
+            if (entry is not None and entry['chunk_size'] == doc_processor.chunk_size
+                    and _source_unchanged(source_path, entry)):
+                documents.append(entry['document_id'])
+                document_concepts.append(entry['concept_ids'])
+                continue
+        
+        # Fehlende Quellen überspringen; der stat im Processor ersetzt exists()
+        try:
+            doc = process(source_path, [tool.tool_id])
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        
+        documents.append(doc)
+        
+        # Extract Concepts
+        document_concepts.append(concept_extractor.extract_concepts(doc.content))
+    
+    return documents, document_concepts
+
+
+def _process_manifest(manifest_path: Optional[str], data: Optional[Dict[str, Any]],
+                      components: Tuple[ToolManifestParser, DocumentProcessor, ConceptExtractor],
+                      st: Optional[os.stat_result] = None,
+                      index_entries: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Verarbeite ein Manifest vollständig ohne Pipeline-Zustand (Prozess-Pool-Worker)
+    
+    Ohne `data` wird das Manifest von `manifest_path` geladen und als erstes
+    Element zurückgegeben (für den ManifestCache), sonst ist es None.
+    """
+    manifest_parser, doc_processor, concept_extractor = components
+    loaded = None
+    if data is None:
+        data = loaded = manifest_parser.load(manifest_path, st)
+    
+    tool = manifest_parser.tool_from_data(data)
+    capabilities = manifest_parser.capabilities_from_data(data)
+    documents, document_concepts = _process_documentation(
+        tool, doc_processor, concept_extractor, index_entries
+    )
+    return loaded, tool, capabilities, documents, document_concepts
+
+
+def _iter_manifest_files(root: str, recursive: bool) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+    """Manifeste (MANIFEST_SUFFIXES) unter root samt stat (None, falls nicht lesbar) per os.scandir
+    
+    Reihenfolge wie Path.glob("**/*"): erst die Dateien eines Verzeichnisses,
+    dann dessen Unterverzeichnisse (ohne Symlinks) in scandir-Reihenfolge.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.name.endswith(MANIFEST_SUFFIXES):
+            try:
+                yield entry.path, entry.stat()
+            except OSError:
+                yield entry.path, None
+    
+    if recursive:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                yield from _iter_manifest_files(entry.path, recursive)
+
+
 class IngestionPipeline:
     """Hauptklasse für AKIS Ingestion Pipeline"""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, incremental: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -326,7 +820,12 @@ class IngestionPipeline:
         self.processed_tools = []
         self.processed_capabilities = []
         self.processed_documents = []
-        self.processed_concepts = []
+        # Concepts je concept_id nur einmal (erstes Vorkommen), statt je Dokument dupliziert
+        self.processed_concepts: Dict[str, Concept] = {}
+        
+        # Inkrementell: unveränderte Dokumentquellen aus dem letzten Lauf übernehmen
+        self.ingest_index = IngestIndex(output_dir) if incremental else None
+        self._document_concepts: Dict[str, List[str]] = {}
         
         logger.info(f"Ingestion Pipeline initialized with output_dir: {output_dir}")
     
@@ -335,52 +834,71 @@ class IngestionPipeline:
         logger.info(f"Ingesting tool manifest: {manifest_path}")
         
         try:
-            # Parse Tool
-            tool = self.manifest_parser.parse_manifest(manifest_path)
-            self.processed_tools.append(tool)
-            
-            # Parse Capabilities
-            capabilities = self.manifest_parser.parse_capabilities(manifest_path)
-            self.processed_capabilities.extend(capabilities)
-            
-            # Process Documentation Sources
-            documents = []
-            for doc_source in tool.documentation_sources:
-                doc_path = doc_source.get('path', '')
-                if Path(doc_path).exists():
-                    if doc_source.get('type') == 'markdown':
-                        doc = self.doc_processor.process_markdown(doc_path, [tool.tool_id])
-                    elif doc_source.get('type') == 'code':
-                        doc = self.doc_processor.process_code(doc_path, [tool.tool_id])
-                    else:
-                        continue
-                    
-                    documents.append(doc)
-                    
-                    # Extract Concepts
-                    concepts = self.concept_extractor.extract_concepts(doc.content)
-                    self.processed_concepts.extend(concepts)
-            
-            self.processed_documents.extend(documents)
-            
-            result = {
-                'tool': asdict(tool),
-                'capabilities': [asdict(cap) for cap in capabilities],
-                'documents': [asdict(doc) for doc in documents],
-                'status': 'success'
-            }
-            
-            logger.info(f"Successfully ingested tool: {tool.name} with {len(capabilities)} capabilities")
-            return result
-            
+            return self.ingest_manifest_data(self.manifest_parser.load(manifest_path))
         except Exception as e:
             logger.error(f"Error ingesting tool manifest {manifest_path}: {e}")
             return {'status': 'error', 'error': str(e)}
     
-    def ingest_directory(self, directory_path: str, recursive: bool = True) -> Dict[str, Any]:
-        """Ingest alle Tool-Manifeste in einem Verzeichnis"""
-        directory = Path(directory_path)
-        pattern = "**/*.yml" if recursive else "*.yml"
+    def ingest_manifest_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Ingest bereits geladenes Manifest"""
+        return self.ingest_parsed_manifest(
+            self.manifest_parser.tool_from_data(data),
+            self.manifest_parser.capabilities_from_data(data)
+        )
+    
+    def ingest_parsed_manifest(self, tool: Tool, capabilities: List[Capability]) -> Dict[str, Any]:
+        """Übernimm geparstes Tool samt Capabilities und verarbeite dessen Dokumentation"""
+        documents, document_concepts = _process_documentation(
+            tool, self.doc_processor, self.concept_extractor, self._index_entries()
+        )
+        return self._merge_processed(tool, capabilities, documents, document_concepts)
+    
+    def _index_entries(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Einträge des IngestIndex für die Worker oder None ohne inkrementellen Modus"""
+        return self.ingest_index.entries if self.ingest_index is not None else None
+    
+    def _merge_processed(self, tool: Tool, capabilities: List[Capability], documents: list,
+                         document_concepts: list) -> Dict[str, Any]:
+        """Übernimm fertig verarbeitete Ergebnisse eines Manifests in die Pipeline"""
+        self.processed_tools.append(tool)
+        self.processed_capabilities.extend(capabilities)
+        for doc, concepts in zip(documents, document_concepts):
+            # Unveränderte Quellen: Objekte des letzten Laufs aus dem IngestIndex
+            if isinstance(doc, str):
+                doc = self.ingest_index.documents[doc]
+                concepts = [self.ingest_index.concepts[cid] for cid in concepts]
+            self.processed_documents.append(doc)
+            for concept in concepts:
+                self.processed_concepts.setdefault(concept.concept_id, concept)
+            if self.ingest_index is not None:
+                self._document_concepts[doc.document_id] = [concept.concept_id for concept in concepts]
+        
+        # Nur Kennzahlen; die Objekte selbst liegen in processed_* und
+        # werden erst von save_processed_data serialisiert
+        result = {
+            'tool_id': tool.tool_id,
+            'capabilities_count': len(capabilities),
+            'documents_count': len(documents),
+            'status': 'success'
+        }
+        
+        logger.info(f"Successfully ingested tool: {tool.name} with {len(capabilities)} capabilities")
+        return result
+    
+    def ingest_directory(self, directory_path: str, recursive: bool = True,
+                         executor: Optional[Executor] = None,
+                         cache: Optional[ManifestCache] = None) -> Dict[str, Any]:
+        """Ingest alle Tool-Manifeste in einem Verzeichnis
+        
+        Mit `executor` (z.B. ProcessPoolExecutor) werden die Manifeste samt
+        Dokumentation und Concepts parallel verarbeitet, mit `cache` werden
+        unveränderte Manifeste gar nicht erst geparst; die Übernahme in die
+        Pipeline erfolgt weiterhin sequentiell in Dateireihenfolge. Im
+        inkrementellen Modus werden unveränderte Dokumentquellen aus dem
+        IngestIndex übernommen statt neu gelesen, gechunkt und analysiert.
+        """
+        # Pfad samt stat aus einem scandir-Lauf; speist Cache-Schlüssel und Loader
+        manifest_files = list(_iter_manifest_files(str(Path(directory_path)), recursive))
         
         results = {
             'processed_files': [],
@@ -393,23 +911,42 @@ class IngestionPipeline:
             }
         }
         
-        for manifest_file in directory.glob(pattern):
+        # Je Datei: laufende Verarbeitung (Future), Cache-Treffer (dict) oder None
+        components = (self.manifest_parser, self.doc_processor, self.concept_extractor)
+        sources = []
+        for manifest_file, st in manifest_files:
+            source = cache.lookup(manifest_file, st) if cache is not None and st is not None else None
+            if executor is not None:
+                path = None if source is not None else manifest_file
+                source = executor.submit(_process_manifest, path, source, components, st,
+                                         self._index_entries())
+            sources.append(source)
+        
+        for (manifest_file, st), source in zip(manifest_files, sources):
+            logger.info(f"Ingesting tool manifest: {manifest_file}")
             try:
-                result = self.ingest_tool_manifest(str(manifest_file))
-                results['processed_files'].append({
-                    'file': str(manifest_file),
-                    'result': result
-                })
-                
-                if result['status'] == 'success':
-                    results['summary']['total_tools'] += 1
-                    results['summary']['total_capabilities'] += len(result['capabilities'])
-                    results['summary']['total_documents'] += len(result['documents'])
-                
+                if isinstance(source, Future):
+                    loaded, *processed = source.result()
+                else:
+                    path = None if source is not None else manifest_file
+                    loaded, *processed = _process_manifest(path, source, components, st,
+                                                           self._index_entries())
+                if loaded is not None and cache is not None:
+                    cache.store(manifest_file, loaded, st)
+                result = self._merge_processed(*processed)
             except Exception as e:
-                error_info = {'file': str(manifest_file), 'error': str(e)}
-                results['errors'].append(error_info)
-                logger.error(f"Failed to process {manifest_file}: {e}")
+                logger.error(f"Error ingesting tool manifest {manifest_file}: {e}")
+                result = {'status': 'error', 'error': str(e)}
+            
+            results['processed_files'].append({
+                'file': manifest_file,
+                'result': result
+            })
+            
+            if result['status'] == 'success':
+                results['summary']['total_tools'] += 1
+                results['summary']['total_capabilities'] += result['capabilities_count']
+                results['summary']['total_documents'] += result['documents_count']
         
         results['summary']['total_concepts'] = len(self.processed_concepts)
         
@@ -420,33 +957,19 @@ class IngestionPipeline:
         """Speichere verarbeitete Daten als JSON"""
         output_files = {}
         
-        # Save Tools
-        tools_file = self.output_dir / "tools.json"
-        with open(tools_file, 'w', encoding='utf-8') as f:
-            tools_data = [asdict(tool) for tool in self.processed_tools]
-            json.dump(tools_data, f, indent=2, ensure_ascii=False, default=str)
-        output_files['tools'] = str(tools_file)
-        
-        # Save Capabilities
-        capabilities_file = self.output_dir / "capabilities.json"
-        with open(capabilities_file, 'w', encoding='utf-8') as f:
-            caps_data = [asdict(cap) for cap in self.processed_capabilities]
-            json.dump(caps_data, f, indent=2, ensure_ascii=False, default=str)
-        output_files['capabilities'] = str(capabilities_file)
-        
-        # Save Documents
-        documents_file = self.output_dir / "documents.json"
-        with open(documents_file, 'w', encoding='utf-8') as f:
-            docs_data = [asdict(doc) for doc in self.processed_documents]
-            json.dump(docs_data, f, indent=2, ensure_ascii=False, default=str)
-        output_files['documents'] = str(documents_file)
-        
-        # Save Concepts
-        concepts_file = self.output_dir / "concepts.json"
-        with open(concepts_file, 'w', encoding='utf-8') as f:
-            concepts_data = [asdict(concept) for concept in self.processed_concepts]
-            json.dump(concepts_data, f, indent=2, ensure_ascii=False, default=str)
-        output_files['concepts'] = str(concepts_file)
+        for name, items in (
+            ('tools', self.processed_tools),
+            ('capabilities', self.processed_capabilities),
+            ('documents', self.processed_documents),
+            ('concepts', list(self.processed_concepts.values()))
+        ):
+            output_file = self.output_dir / f"{name}.json"
+            _write_json(output_file, items)
+            output_files[name] = str(output_file)
+        
+        if self.ingest_index is not None:
+            self.ingest_index.save(self.processed_documents, self._document_concepts,
+                                   self.doc_processor.chunk_size)
         
         logger.info(f"Saved processed data to {len(output_files)} files")
         return output_files
@@ -479,18 +1002,16 @@ class IngestionPipeline:
             report['tool_overview'].append(tool_info)
         
         # Maturity Distribution
-        maturity_counts = {}
-        for cap in self.processed_capabilities:
-            current_level = cap.get_current_maturity_level()
-            maturity_counts[current_level.name] = maturity_counts.get(current_level.name, 0) + 1
-        report['capability_maturity_distribution'] = maturity_counts
+        maturity_counts = Counter(
+            cap.get_current_maturity_level().name for cap in self.processed_capabilities
+        )
+        report['capability_maturity_distribution'] = dict(maturity_counts)
         
         # Compliance Coverage
-        compliance_counts = {}
-        for tool in self.processed_tools:
-            for tag in tool.compliance_tags:
-                compliance_counts[tag.value] = compliance_counts.get(tag.value, 0) + 1
-        report['compliance_coverage'] = compliance_counts
+        compliance_counts = Counter(
+            tag.value for tool in self.processed_tools for tag in tool.compliance_tags
+        )
+        report['compliance_coverage'] = dict(compliance_counts)
         
         # Recommendations
         if len(self.processed_tools) < 5:
@@ -0,0 +1,177 @@
+"""
+AKIS msgspec-Modelle
+====================
+
+msgspec.Struct-Gegenstücke zu den Speicher-Dataclasses aus `models`
+(DocumentChunk, Document, KnowledgeSnapshot, BenchmarkCase) für schnelle
+MessagePack-Serialisierung bei Snapshot-Export und Cache-Ablage.
+Die Dataclasses bleiben die In-Memory-API; msgspec ist optional.
+Content-Hashes liegen in den Structs als Roh-Digest (bytes) statt als
+Hex-String; die Dataclasses und die JSON-Ablage behalten den Hex-String.
+"""
+
+import datetime
+import struct
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Union
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from .models import (
+    BenchmarkMetric, BenchmarkCase, DocumentChunk, Document, KnowledgeSnapshot,
+    ComplianceTag
+)
+
+# Länge je Frame als 4 Byte big-endian vor dem MessagePack-Payload
+_FRAME_HEADER = struct.Struct(">I")
+
+if msgspec is not None:
+    class BenchmarkMetricStruct(msgspec.Struct):
+        """Struct-Spiegel von BenchmarkMetric"""
+        name: str
+        target_value: Union[float, int, str]
+        tolerance: float = 0.05
+        unit: str = ""
+        description: str = ""
+
+    class BenchmarkCaseStruct(msgspec.Struct):
+        """Struct-Spiegel von BenchmarkCase"""
+        case_id: str
+        capability_ref: str
+        description: str
+        input_data: Dict[str, Any]
+        expected_outcome: Any
+        target_metrics: List[BenchmarkMetricStruct] = []
+        success_criteria: str = ""
+        created_at: datetime.datetime = msgspec.field(default_factory=datetime.datetime.now)
+        last_run: Optional[datetime.datetime] = None
+        last_result: Optional[Dict[str, Any]] = None
+
+    class DocumentChunkStruct(msgspec.Struct):
+        """Struct-Spiegel von DocumentChunk"""
+        chunk_id: str
+        document_id: str
+        content: str
+        chunk_index: int
+        embedding_row: int = -1
+        hash: bytes = b""  # Roh-Digest statt Hex-String
+        tool_refs: List[str] = []
+        capability_refs: List[str] = []
+        concept_refs: List[str] = []
+        metadata: Dict[str, Any] = {}
+        created_at: datetime.datetime = msgspec.field(default_factory=datetime.datetime.now)
+
+    class DocumentStruct(msgspec.Struct):
+        """Struct-Spiegel von Document"""
+        document_id: str
+        source_path: str
+        source_type: str
+        hash: bytes = b""  # Roh-Digest statt Hex-String
+        title: str = ""
+        content: str = ""
+        chunks: List[DocumentChunkStruct] = []
+        tool_refs: List[str] = []
+        capability_refs: List[str] = []
+        compliance_classification: List[ComplianceTag] = []
+        version: str = "1.0"
+        created_at: datetime.datetime = msgspec.field(default_factory=datetime.datetime.now)
+        updated_at: datetime.datetime = msgspec.field(default_factory=datetime.datetime.now)
+        metadata: Dict[str, Any] = {}
+
+    class KnowledgeSnapshotStruct(msgspec.Struct):
+        """Struct-Spiegel von KnowledgeSnapshot"""
+        snapshot_id: str
+        created_at: datetime.datetime
+        graph_hash: str
+        vector_index_hash: str
+        tool_versions: Dict[str, str] = {}
+        coverage_metrics: Dict[str, Any] = {}
+        quality_metrics: Dict[str, float] = {}
+        metadata: Dict[str, Any] = {}
+
+    # Dataclass <-> Struct; verschachtelte Listen werden elementweise umgesetzt
+    _STRUCT_OF = {
+        BenchmarkMetric: BenchmarkMetricStruct,
+        BenchmarkCase: BenchmarkCaseStruct,
+        DocumentChunk: DocumentChunkStruct,
+        Document: DocumentStruct,
+        KnowledgeSnapshot: KnowledgeSnapshotStruct,
+    }
+    _DATACLASS_OF = {struct_type: cls for cls, struct_type in _STRUCT_OF.items()}
+
+    # Felder mit eigener Darstellung im Struct: Hex-Hash <-> Roh-Bytes (halbe Größe)
+    _TO_STRUCT_FIELDS = {'hash': bytes.fromhex}
+    _FROM_STRUCT_FIELDS = {'hash': bytes.hex}
+
+    _ENCODER = msgspec.msgpack.Encoder()
+
+
+def _require_msgspec() -> None:
+    if msgspec is None:
+        raise ImportError("msgspec is required for MessagePack serialization (pip install msgspec)")
+
+
+def _convert(value: Any, table: Dict[type, type]) -> Any:
+    """Liste verschachtelter Modelle umsetzen, alles andere unverändert übernehmen"""
+    if isinstance(value, list) and value and type(value[0]) in table:
+        return [_convert_one(item, table) for item in value]
+    return value
+
+
+def _convert_one(obj: Any, table: Dict[type, type]) -> Any:
+    target = table[type(obj)]
+    struct_type = target if table is _STRUCT_OF else type(obj)
+    converters = _TO_STRUCT_FIELDS if table is _STRUCT_OF else _FROM_STRUCT_FIELDS
+    values = {name: _convert(getattr(obj, name), table) for name in struct_type.__struct_fields__}
+    for name in converters.keys() & values.keys():
+        values[name] = converters[name](values[name])
+    return target(**values)
+
+
+def to_struct(obj: Any) -> Any:
+    """Dataclass (DocumentChunk, Document, KnowledgeSnapshot, BenchmarkCase) zu ihrem Struct"""
+    _require_msgspec()
+    return _convert_one(obj, _STRUCT_OF)
+
+
+def from_struct(obj: Any) -> Any:
+    """Struct zurück zur entsprechenden Dataclass"""
+    _require_msgspec()
+    return _convert_one(obj, _DATACLASS_OF)
+
+
+def encode_frames(items: Iterable[Any]) -> bytes:
+    """Kodiere Dataclasses/Structs als längenpräfixierte MessagePack-Frames"""
+    _require_msgspec()
+    frames = []
+    for item in items:
+        payload = _ENCODER.encode(item if isinstance(item, msgspec.Struct) else to_struct(item))
+        frames.append(_FRAME_HEADER.pack(len(payload)))
+        frames.append(payload)
+    return b"".join(frames)
+
+
+def decode_frames(data: bytes, struct_type: type) -> Iterator[Any]:
+    """Dekodiere längenpräfixierte Frames zu Structs vom Typ `struct_type`"""
+    _require_msgspec()
+    decoder = msgspec.msgpack.Decoder(struct_type)
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        (length,) = _FRAME_HEADER.unpack_from(view, offset)
+        offset += _FRAME_HEADER.size
+        yield decoder.decode(view[offset:offset + length])
+        offset += length
+
+
+def write_frames(path: Union[str, Path], items: Iterable[Any]) -> None:
+    """Schreibe Objekte als MessagePack-Frames in eine Datei"""
+    Path(path).write_bytes(encode_frames(items))
+
+
+def read_frames(path: Union[str, Path], struct_type: type) -> List[Any]:
+    """Lese alle Frames einer Datei als Structs"""
+    return list(decode_frames(Path(path).read_bytes(), struct_type))
@@ -7,19 +7,35 @@ Implementiert die 7-Schichten-Architektur mit Lernkurven-Integration.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Union
-from enum import Enum
+from bisect import bisect_right
+from typing import List, Dict, Optional, Any, Tuple, Union
+from enum import Enum, IntEnum
 import datetime
+import os
+import sys
 import uuid
 
-class MaturityLevel(Enum):
-    """Maturity Level für Tools und Capabilities"""
+# dataclass(slots=True) gibt es erst ab Python 3.10; ohne __dict__ kleinere Instanzen
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+class MaturityLevel(IntEnum):
+    """Maturity Level für Tools und Capabilities
+    
+    IntEnum: Vergleiche laufen als int-Vergleich und Levels taugen direkt als Listenindex.
+    """
     AWARENESS = 0           # Bewusstsein
     BASIC_EXECUTION = 1     # Grundlegende Ausführung
     EFFICIENT_EXECUTION = 2 # Effiziente Ausführung
     ADAPTIVE_OPTIMIZATION = 3  # Adaptive Optimierung
     PREDICTIVE_PROACTIVE = 4   # Prädiktiv/Proaktiv
     AUTONOMOUS_SELF_TUNING = 5 # Autonome Selbstoptimierung
+    
+    # Textform wie bisher "MaturityLevel.NAME" (IntEnum gäbe je nach Version nur die Zahl aus)
+    def __str__(self):
+        return f"{type(self).__name__}.{self._name_}"
+    
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
 
 class RiskLevel(Enum):
     """Risiko-Level für Tools und Operationen"""
@@ -38,46 +54,93 @@ class ComplianceTag(Enum):
     DATA_GOVERNANCE = "data_governance"
     CONTENT_POLICY = "content_policy"
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Internierter String (andere Werte unverändert)"""
+    return sys.intern(value) if type(value) is str else value
+
+def _intern_all(values: List[Any]) -> None:
+    """Strings einer Liste in place durch ihre internierte Form ersetzen"""
+    for i, value in enumerate(values):
+        if type(value) is str:
+            values[i] = sys.intern(value)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class LearningCurveLevel:
-    """Einzelner Level in einer Lernkurve"""
+    """Einzelner Level in einer Lernkurve (unveränderlich, hashbar)"""
     level: MaturityLevel
     description: str
     expected_accuracy: float      # 0.0 - 1.0
     max_latency_ms: int          # Maximale Latenz in ms
     risk_factor: float           # 0.0 - 1.0 (niedriger = weniger Risiko)
     min_evidence_docs: int       # Mindestanzahl Evidenz-Dokumente
-    required_capabilities: List[str] = field(default_factory=list)
-    typical_errors: List[str] = field(default_factory=list)
-    recovery_strategies: List[str] = field(default_factory=list)
+    # Listen zählen für __eq__, nicht für __hash__
+    required_capabilities: List[str] = field(default_factory=list, hash=False)
+    typical_errors: List[str] = field(default_factory=list, hash=False)
+    recovery_strategies: List[str] = field(default_factory=list, hash=False)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MaturityProfile:
     """Komplette Lernkurve für eine Capability"""
     profile_id: str
     name: str
     description: str
-    levels: List[LearningCurveLevel] = field(default_factory=list)
+    # Unveränderlich (Listen werden in __post_init__ zu Tupeln); Änderungen über
+    # add_level()/remove_level() oder Zuweisung eines neuen Tupels
+    levels: Tuple[LearningCurveLevel, ...] = ()
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
     updated_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+    # LearningCurveLevel je int(MaturityLevel) und das levels-Tupel, aus dem er gebaut wurde
+    _level_index: List[Optional[LearningCurveLevel]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    _indexed_levels: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.levels = tuple(self.levels)
+        self._reindex_levels()
+    
+    def _reindex_levels(self) -> None:
+        """Baue den Level-Index auf; wie beim linearen Scan gilt das erste Vorkommen"""
+        if not isinstance(self.levels, tuple):
+            self.levels = tuple(self.levels)
+        index: List[Optional[LearningCurveLevel]] = [None] * len(MaturityLevel)
+        for curve_level in self.levels:
+            if 0 <= curve_level.level < len(index) and index[curve_level.level] is None:
+                index[curve_level.level] = curve_level
+        self._level_index = index
+        self._indexed_levels = self.levels
     
     def get_level(self, level: MaturityLevel) -> Optional[LearningCurveLevel]:
         """Hole spezifischen Level aus der Lernkurve"""
-        for curve_level in self.levels:
-            if curve_level.level == level:
-                return curve_level
-        return None
+        # Ein Tupel ändert sich nicht in place: neues levels-Objekt erzwingt neuen Index
+        if self._indexed_levels is not self.levels:
+            self._reindex_levels()
+        try:
+            return self._level_index[level] if level >= 0 else None
+        except (IndexError, TypeError):
+            return None
+    
+    def add_level(self, curve_level: LearningCurveLevel) -> None:
+        """Füge Level zur Lernkurve hinzu"""
+        self.levels = self.levels + (curve_level,)
+        self._reindex_levels()
+    
+    def remove_level(self, level: MaturityLevel) -> Optional[LearningCurveLevel]:
+        """Entferne alle Einträge eines Levels; liefert den bisher gültigen Eintrag"""
+        removed = self.get_level(level)
+        self.levels = tuple(curve_level for curve_level in self.levels if curve_level.level != level)
+        self._reindex_levels()
+        return removed
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BenchmarkMetric:
-    """Einzelne Benchmark-Metrik"""
+    """Einzelne Benchmark-Metrik (unveränderlich, hashbar)"""
     name: str
     target_value: Union[float, int, str]
     tolerance: float = 0.05
     unit: str = ""
     description: str = ""
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BenchmarkCase:
     """Test-Case für Capability-Validierung"""
     case_id: str
@@ -90,8 +153,34 @@ class BenchmarkCase:
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
     last_run: Optional[datetime.datetime] = None
     last_result: Optional[Dict[str, Any]] = None
+    
+    def to_struct(self):
+        """msgspec-Struct für MessagePack-Serialisierung (erfordert msgspec)"""
+        from ._msgspec_models import to_struct
+        return to_struct(self)
+    
+    @classmethod
+    def from_struct(cls, obj) -> "BenchmarkCase":
+        """BenchmarkCase aus seinem msgspec-Struct"""
+        from ._msgspec_models import from_struct
+        return from_struct(obj)
 
-@dataclass
+def _benchmark_succeeded(benchmark: BenchmarkCase) -> bool:
+    """Ist der letzte Lauf eines Benchmarks erfolgreich"""
+    result = benchmark.last_result
+    return bool(result and result.get('success', False))
+
+# Erfolgsquote-Schwellen (aufsteigend) und das jeweils ab dort erreichte Maturity Level
+_SUCCESS_RATE_THRESHOLDS = (0.60, 0.75, 0.85, 0.90, 0.95)
+_SUCCESS_RATE_LEVELS = (
+    MaturityLevel.BASIC_EXECUTION,
+    MaturityLevel.EFFICIENT_EXECUTION,
+    MaturityLevel.ADAPTIVE_OPTIMIZATION,
+    MaturityLevel.PREDICTIVE_PROACTIVE,
+    MaturityLevel.AUTONOMOUS_SELF_TUNING,
+)
+
+@dataclass(**_DATACLASS_SLOTS)
 class Capability:
     """Fähigkeit eines Tools oder Systems"""
     capability_id: str
@@ -113,28 +202,13 @@ class Capability:
             return MaturityLevel.AWARENESS
         
         # Vereinfachte Logik - kann erweitert werden
-        successful_benchmarks = sum(1 for b in self.benchmarks if b.last_result and b.last_result.get('success', False))
-        total_benchmarks = len(self.benchmarks)
+        success_rate = sum(1 for b in self.benchmarks if _benchmark_succeeded(b)) / len(self.benchmarks)
         
-        if total_benchmarks == 0:
-            return MaturityLevel.AWARENESS
-        
-        success_rate = successful_benchmarks / total_benchmarks
-        
-        if success_rate >= 0.95:
-            return MaturityLevel.AUTONOMOUS_SELF_TUNING
-        elif success_rate >= 0.90:
-            return MaturityLevel.PREDICTIVE_PROACTIVE
-        elif success_rate >= 0.85:
-            return MaturityLevel.ADAPTIVE_OPTIMIZATION
-        elif success_rate >= 0.75:
-            return MaturityLevel.EFFICIENT_EXECUTION
-        elif success_rate >= 0.60:
-            return MaturityLevel.BASIC_EXECUTION
-        else:
-            return MaturityLevel.AWARENESS
+        # Höchste erreichte Schwelle per Binärsuche statt if/elif-Kaskade
+        idx = bisect_right(_SUCCESS_RATE_THRESHOLDS, success_rate)
+        return _SUCCESS_RATE_LEVELS[idx - 1] if idx else MaturityLevel.AWARENESS
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Tool:
     """Tool oder System im AKIS"""
     tool_id: str
@@ -153,42 +227,82 @@ class Tool:
     
     def is_compliant_with(self, required_tags: List[ComplianceTag]) -> bool:
         """Prüfe ob Tool alle erforderlichen Compliance-Tags hat"""
-        return all(tag in self.compliance_tags for tag in required_tags)
+        # Menge bei jedem Aufruf aus der aktuellen Liste (O(m + r) statt O(m * r))
+        return frozenset(self.compliance_tags).issuperset(required_tags)
+    
+    def add_compliance_tag(self, tag: ComplianceTag) -> None:
+        """Ergänze Compliance-Tag (ohne Duplikate)"""
+        if tag not in self.compliance_tags:
+            self.compliance_tags.append(tag)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DocumentChunk:
     """Chunk eines verarbeiteten Dokuments"""
     chunk_id: str
     document_id: str
     content: str
     chunk_index: int
+    embedding_row: int = -1  # Zeile in der EmbeddingMatrix des Retrievals, -1 = ohne Embedding
+    hash: str = ""
     tool_refs: List[str] = field(default_factory=list)
     capability_refs: List[str] = field(default_factory=list)
     concept_refs: List[str] = field(default_factory=list)
-    embedding: Optional[List[float]] = None
-    hash: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+    
+    def __post_init__(self):
+        # Dokument-ID und Refs wiederholen sich über viele Chunks (z.B. nach JSON-Import)
+        self.document_id = _intern(self.document_id)
+        _intern_all(self.tool_refs)
+        _intern_all(self.capability_refs)
+        _intern_all(self.concept_refs)
+    
+    def to_struct(self):
+        """msgspec-Struct für MessagePack-Serialisierung (erfordert msgspec)"""
+        from ._msgspec_models import to_struct
+        return to_struct(self)
+    
+    @classmethod
+    def from_struct(cls, obj) -> "DocumentChunk":
+        """DocumentChunk aus seinem msgspec-Struct"""
+        from ._msgspec_models import from_struct
+        return from_struct(obj)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Document:
     """Dokument im Knowledge Base"""
     document_id: str
     source_path: str
     source_type: str  # markdown, code, openapi, etc.
+    hash: str = ""
     title: str = ""
     content: str = ""
     chunks: List[DocumentChunk] = field(default_factory=list)
     tool_refs: List[str] = field(default_factory=list)
     capability_refs: List[str] = field(default_factory=list)
     compliance_classification: List[ComplianceTag] = field(default_factory=list)
-    hash: str = ""
     version: str = "1.0"
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
     updated_at: datetime.datetime = field(default_factory=datetime.datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self.source_type = _intern(self.source_type)
+        _intern_all(self.tool_refs)
+        _intern_all(self.capability_refs)
+    
+    def to_struct(self):
+        """msgspec-Struct für MessagePack-Serialisierung (erfordert msgspec)"""
+        from ._msgspec_models import to_struct
+        return to_struct(self)
+    
+    @classmethod
+    def from_struct(cls, obj) -> "Document":
+        """Document aus seinem msgspec-Struct"""
+        from ._msgspec_models import from_struct
+        return from_struct(obj)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Concept:
     """Konzept in der Ontologie"""
     concept_id: str
@@ -200,21 +314,46 @@ class Concept:
     domain_tags: List[str] = field(default_factory=list)
     confidence_score: float = 1.0
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+    # (taxonomy_path, Pfadteile, Präfixe) – vorberechnet für Hierarchie-Abfragen
+    _taxonomy_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._index_taxonomy()
+    
+    def _index_taxonomy(self) -> tuple:
+        """Pfadteile und Präfix-Menge; neu gebaut wenn taxonomy_path ersetzt wurde"""
+        path = self.taxonomy_path
+        index = self._taxonomy_index
+        if index is None or index[0] is not path:
+            parts = tuple(sys.intern(part) for part in path.split('.'))
+            prefixes = frozenset('.'.join(parts[:i]) for i in range(1, len(parts) + 1))
+            index = self._taxonomy_index = (path, parts, prefixes)
+        return index
     
-@dataclass
+    @property
+    def taxonomy_parts(self) -> Tuple[str, ...]:
+        """Komponenten von taxonomy_path"""
+        return self._index_taxonomy()[1]
+    
+    def is_descendant_of(self, other_path: str) -> bool:
+        """Prüfe ob das Konzept unter `other_path` liegt (oder der Pfad selbst ist)"""
+        return other_path in self._index_taxonomy()[2]
+    
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Relation:
-    """Relation zwischen Entitäten"""
+    """Relation zwischen Entitäten (unveränderlich, hashbar)"""
     relation_id: str
     subject: str
     predicate: str
     object: str
     confidence: float = 1.0
     provenance: str = ""
-    temporal_validity: Optional[Dict[str, datetime.datetime]] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Dicts zählen für __eq__, nicht für __hash__
+    temporal_validity: Optional[Dict[str, datetime.datetime]] = field(default=None, hash=False)
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False)
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PolicyRule:
     """Policy-Regel für Governance"""
     rule_id: str
@@ -228,7 +367,7 @@ class PolicyRule:
     created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
     active: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class KnowledgeSnapshot:
     """Snapshot der Knowledge Base"""
     snapshot_id: str
@@ -239,8 +378,19 @@ class KnowledgeSnapshot:
     coverage_metrics: Dict[str, Any] = field(default_factory=dict)
     quality_metrics: Dict[str, float] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_struct(self):
+        """msgspec-Struct für MessagePack-Serialisierung (erfordert msgspec)"""
+        from ._msgspec_models import to_struct
+        return to_struct(self)
+    
+    @classmethod
+    def from_struct(cls, obj) -> "KnowledgeSnapshot":
+        """KnowledgeSnapshot aus seinem msgspec-Struct"""
+        from ._msgspec_models import from_struct
+        return from_struct(obj)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RetrievalContext:
     """Kontext für Knowledge Retrieval"""
     user_id: str = ""
@@ -258,61 +408,53 @@ def generate_id() -> str:
     """Generiere eindeutige ID"""
     return str(uuid.uuid4())
 
-# Vordefinierte Maturity Profiles für häufige Use Cases
-DEFAULT_MATURITY_PROFILES = {
-    "video_generation_profile_v1": MaturityProfile(
-        profile_id="video_generation_profile_v1",
-        name="Video Generation Maturity",
-        description="Lernkurve für AI Video Generation",
-        levels=[
-            LearningCurveLevel(
-                level=MaturityLevel.AWARENESS,
-                description="Bewusstsein für Video-AI Tools",
-                expected_accuracy=0.6,
-                max_latency_ms=30000,
-                risk_factor=0.8,
-                min_evidence_docs=5
-            ),
-            LearningCurveLevel(
-                level=MaturityLevel.BASIC_EXECUTION,
-                description="Grundlegende Videogenerierung",
-                expected_accuracy=0.75,
-                max_latency_ms=20000,
-                risk_factor=0.6,
-                min_evidence_docs=3
-            ),
-            LearningCurveLevel(
-                level=MaturityLevel.EFFICIENT_EXECUTION,
-                description="Effiziente Videoproduktion",
-                expected_accuracy=0.85,
-                max_latency_ms=15000,
-                risk_factor=0.4,
-                min_evidence_docs=2
-            ),
-            LearningCurveLevel(
-                level=MaturityLevel.ADAPTIVE_OPTIMIZATION,
-                description="Adaptive Optimierung",
-                expected_accuracy=0.92,
-                max_latency_ms=10000,
-                risk_factor=0.3,
-                min_evidence_docs=1
-            ),
-            LearningCurveLevel(
-                level=MaturityLevel.PREDICTIVE_PROACTIVE,
-                description="Prädiktive Videoproduktion",
-                expected_accuracy=0.96,
-                max_latency_ms=8000,
-                risk_factor=0.2,
-                min_evidence_docs=1
-            ),
-            LearningCurveLevel(
-                level=MaturityLevel.AUTONOMOUS_SELF_TUNING,
-                description="Autonome Selbstoptimierung",
-                expected_accuracy=0.98,
-                max_latency_ms=5000,
-                risk_factor=0.1,
-                min_evidence_docs=1
-            )
-        ]
-    )
-}
\ No newline at end of file
+def generate_ids(count: int) -> List[str]:
+    """Generiere `count` eindeutige IDs im Format von generate_id() aus einem os.urandom-Aufruf"""
+    raw = bytearray(os.urandom(16 * count))
+    # Version 4 und RFC-4122-Variante setzen wie uuid.uuid4()
+    raw[6::16] = bytes((b & 0x0F) | 0x40 for b in raw[6::16])
+    raw[8::16] = bytes((b & 0x3F) | 0x80 for b in raw[8::16])
+    h = raw.hex()
+    return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, 32 * count, 32)]
+
+# Vordefinierte Maturity Profiles für häufige Use Cases als eingefrorene Tabelle:
+# (profile_id, name, description, ((level, description, expected_accuracy,
+#  max_latency_ms, risk_factor, min_evidence_docs), ...))
+_DEFAULT_MATURITY_PROFILE_SPECS = (
+    ("video_generation_profile_v1", "Video Generation Maturity", "Lernkurve für AI Video Generation", (
+        (MaturityLevel.AWARENESS, "Bewusstsein für Video-AI Tools", 0.6, 30000, 0.8, 5),
+        (MaturityLevel.BASIC_EXECUTION, "Grundlegende Videogenerierung", 0.75, 20000, 0.6, 3),
+        (MaturityLevel.EFFICIENT_EXECUTION, "Effiziente Videoproduktion", 0.85, 15000, 0.4, 2),
+        (MaturityLevel.ADAPTIVE_OPTIMIZATION, "Adaptive Optimierung", 0.92, 10000, 0.3, 1),
+        (MaturityLevel.PREDICTIVE_PROACTIVE, "Prädiktive Videoproduktion", 0.96, 8000, 0.2, 1),
+        (MaturityLevel.AUTONOMOUS_SELF_TUNING, "Autonome Selbstoptimierung", 0.98, 5000, 0.1, 1),
+    )),
+)
+
+
+def _build_default_maturity_profiles() -> Dict[str, MaturityProfile]:
+    """Baue DEFAULT_MATURITY_PROFILES aus der Spezifikationstabelle"""
+    return {
+        profile_id: MaturityProfile(
+            profile_id=profile_id,
+            name=name,
+            description=description,
+            levels=[
+                LearningCurveLevel(
+                    level=level,
+                    description=level_description,
+                    expected_accuracy=expected_accuracy,
+                    max_latency_ms=max_latency_ms,
+                    risk_factor=risk_factor,
+                    min_evidence_docs=min_evidence_docs
+                )
+                for level, level_description, expected_accuracy, max_latency_ms,
+                    risk_factor, min_evidence_docs in levels
+            ]
+        )
+        for profile_id, name, description, levels in _DEFAULT_MATURITY_PROFILE_SPECS
+    }
+
+
+DEFAULT_MATURITY_PROFILES = _build_default_maturity_profiles()
@@ -11,6 +11,7 @@ __all__ = [
     'AKISRetrievalEngine',
     'KnowledgeGraph', 
     'VectorStore',
+    'EmbeddingMatrix',
     'LexicalSearch',
     'SkillLevelAdaptiveRetriever'
 ]
\ No newline at end of file
@@ -6,8 +6,10 @@ Implementiert Hybrid Retrieval: Graph + Vector + Lexical Search
 mit Skill-Level-Conditioning für optimale Knowledge-Antworten.
 """
 
+import datetime
 import json
 import sqlite3
+import threading
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import asdict
@@ -28,11 +30,14 @@ class KnowledgeGraph:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn = None
+        # Eine Verbindung für alle Threads; Zugriffe laufen unter diesem Lock
+        self._lock = threading.Lock()
         self._init_database()
     
     def _init_database(self):
         """Initialisiere Graph-Datenbank (SQLite für Prototyp)"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Queries laufen im Thread-Pool des Servers, nicht im erzeugenden Thread
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         
         # Erstelle Tabellen
@@ -67,46 +72,51 @@ class KnowledgeGraph:
     def upsert_entity(self, entity_id: str, entity_type: str, 
                      name: str, data: Dict[str, Any]):
         """Füge Entity hinzu oder aktualisiere sie"""
-        self.conn.execute("""
-        INSERT OR REPLACE INTO entities (id, type, name, data)
-        VALUES (?, ?, ?, ?)
-        """, (entity_id, entity_type, name, json.dumps(data)))
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute("""
+            INSERT OR REPLACE INTO entities (id, type, name, data)
+            VALUES (?, ?, ?, ?)
+            """, (entity_id, entity_type, name, json.dumps(data)))
+            self.conn.commit()
     
     def upsert_relation(self, relation_id: str, subject: str, 
                        predicate: str, obj: str, confidence: float = 1.0,
                        data: Dict[str, Any] = None):
         """Füge Relation hinzu oder aktualisiere sie"""
         data_json = json.dumps(data or {})
-        self.conn.execute("""
-        INSERT OR REPLACE INTO relations (id, subject, predicate, object, confidence, data)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """, (relation_id, subject, predicate, obj, confidence, data_json))
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute("""
+            INSERT OR REPLACE INTO relations (id, subject, predicate, object, confidence, data)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """, (relation_id, subject, predicate, obj, confidence, data_json))
+            self.conn.commit()
     
     def get_capabilities_for_tool(self, tool_id: str) -> List[str]:
         """Hole alle Capabilities eines Tools"""
-        cursor = self.conn.execute("""
-        SELECT object FROM relations 
-        WHERE subject = ? AND predicate = 'HAS_CAPABILITY'
-        """, (tool_id,))
-        return [row['object'] for row in cursor.fetchall()]
+        with self._lock:
+            rows = self.conn.execute("""
+            SELECT object FROM relations 
+            WHERE subject = ? AND predicate = 'HAS_CAPABILITY'
+            """, (tool_id,)).fetchall()
+        return [row['object'] for row in rows]
     
     def get_concepts_for_capability(self, capability_id: str) -> List[str]:
         """Hole alle Concepts einer Capability"""
-        cursor = self.conn.execute("""
-        SELECT object FROM relations 
-        WHERE subject = ? AND predicate IN ('GROUNDED_IN', 'RELATES_TO')
-        """, (capability_id,))
-        return [row['object'] for row in cursor.fetchall()]
+        with self._lock:
+            rows = self.conn.execute("""
+            SELECT object FROM relations 
+            WHERE subject = ? AND predicate IN ('GROUNDED_IN', 'RELATES_TO')
+            """, (capability_id,)).fetchall()
+        return [row['object'] for row in rows]
     
     def get_tools_by_capability(self, capability_id: str) -> List[str]:
         """Hole alle Tools die eine bestimmte Capability haben"""
-        cursor = self.conn.execute("""
-        SELECT subject FROM relations 
-        WHERE object = ? AND predicate = 'HAS_CAPABILITY'
-        """, (capability_id,))
-        return [row['subject'] for row in cursor.fetchall()]
+        with self._lock:
+            rows = self.conn.execute("""
+            SELECT subject FROM relations 
+            WHERE object = ? AND predicate = 'HAS_CAPABILITY'
+            """, (capability_id,)).fetchall()
+        return [row['subject'] for row in rows]
     
     def expand_related_entities(self, entity_id: str, 
                                max_depth: int = 2) -> List[Tuple[str, str, float]]:
@@ -124,15 +134,16 @@ class KnowledgeGraph:
             visited.add(current_entity)
             
             # Hole direkte Nachbarn
-            cursor = self.conn.execute("""
-            SELECT object, predicate, confidence FROM relations 
-            WHERE subject = ?
-            UNION
-            SELECT subject, predicate, confidence FROM relations 
-            WHERE object = ?
-            """, (current_entity, current_entity))
+            with self._lock:
+                rows = self.conn.execute("""
+                SELECT object, predicate, confidence FROM relations 
+                WHERE subject = ?
+                UNION
+                SELECT subject, predicate, confidence FROM relations 
+                WHERE object = ?
+                """, (current_entity, current_entity)).fetchall()
             
-            for row in cursor.fetchall():
+            for row in rows:
                 neighbor = row['object'] if row['object'] != current_entity else row['subject']
                 predicate = row['predicate']
                 rel_confidence = row['confidence'] * confidence
@@ -144,17 +155,66 @@ class KnowledgeGraph:
         return sorted(related, key=lambda x: x[2], reverse=True)
 
 
+class EmbeddingMatrix:
+    """Embeddings gleicher Dimension als eine zusammenhängende (N, D)-float32-Matrix
+    
+    Statt je Chunk einen eigenen Vektor zu halten, liegt Zeile i für
+    `chunk_ids[i]`; `row_of_chunk` bildet IDs auf Zeilen ab. Die Cosine
+    Similarity aller Zeilen ist damit ein einziges `matrix @ query`.
+    """
+    
+    def __init__(self, dim: int, capacity: int = 16):
+        self.dim = dim
+        self._buffer = np.empty((max(capacity, 1), dim), dtype=np.float32)
+        self._norms = np.empty(max(capacity, 1), dtype=np.float32)
+        self.chunk_ids: List[str] = []
+        self.row_of_chunk: Dict[str, int] = {}
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Belegte Zeilen als (N, D)-Sicht auf den Puffer"""
+        return self._buffer[:len(self.chunk_ids)]
+    
+    def set(self, chunk_id: str, embedding) -> int:
+        """Setze Embedding eines Chunks (neue Zeile oder überschreiben); liefert die Zeile"""
+        row = self.row_of_chunk.get(chunk_id)
+        if row is None:
+            row = len(self.chunk_ids)
+            if row == len(self._buffer):
+                # Kapazität verdoppeln statt je Zeile neu zu allozieren
+                self._buffer = np.concatenate([self._buffer, np.empty_like(self._buffer)])
+                self._norms = np.concatenate([self._norms, np.empty_like(self._norms)])
+            self.chunk_ids.append(chunk_id)
+            self.row_of_chunk[chunk_id] = row
+        self._buffer[row] = embedding
+        self._norms[row] = np.linalg.norm(self._buffer[row])
+        return row
+    
+    def similarities(self, query_embedding) -> np.ndarray:
+        """Cosine Similarity der Query zu allen Zeilen (Reihenfolge wie chunk_ids)"""
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        size = len(self.chunk_ids)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self._buffer[:size] @ query_vec) / (self._norms[:size] * np.linalg.norm(query_vec))
+
+
 class VectorStore:
     """Vector Store für semantische Suche"""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn = None
+        # Eine Verbindung für alle Threads; Zugriffe und Cache-Neuaufbau laufen unter diesem Lock
+        self._lock = threading.Lock()
+        # Embeddings je Dimension als Matrix; None = beim nächsten search() aus der DB laden
+        self._matrices: Optional[Dict[int, EmbeddingMatrix]] = None
+        self._rows: Dict[str, Tuple[str, str]] = {}
         self._init_database()
     
     def _init_database(self):
         """Initialisiere Vector Store (SQLite mit JSON für Prototyp)"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Queries laufen im Thread-Pool des Servers, nicht im erzeugenden Thread
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         
         self.conn.execute("""
@@ -171,47 +231,81 @@ class VectorStore:
     def upsert_vector(self, doc_id: str, content: str, 
                      embedding: List[float], metadata: Dict[str, Any] = None):
         """Füge Vektor hinzu oder aktualisiere ihn"""
-        self.conn.execute("""
-        INSERT OR REPLACE INTO vectors (id, content, embedding, metadata)
-        VALUES (?, ?, ?, ?)
-        """, (doc_id, content, json.dumps(embedding), json.dumps(metadata or {})))
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute("""
+            INSERT OR REPLACE INTO vectors (id, content, embedding, metadata)
+            VALUES (?, ?, ?, ?)
+            """, (doc_id, content, json.dumps(embedding), json.dumps(metadata or {})))
+            self.conn.commit()
+            self._matrices = None
+    
+    def _load_matrices(self) -> Dict[int, EmbeddingMatrix]:
+        """Lade alle Embeddings einmal in Matrizen je Dimension (Tabellenreihenfolge)
+        
+        Aufrufer hält self._lock.
+        """
+        matrices: Dict[int, EmbeddingMatrix] = {}
+        rows: Dict[str, Tuple[str, str]] = {}
+        for row in self.conn.execute("SELECT id, content, embedding, metadata FROM vectors"):
+            try:
+                vec = np.asarray(json.loads(row['embedding']), dtype=np.float32)
+            except (TypeError, ValueError):
+                continue
+            if vec.ndim != 1:
+                continue
+            matrix = matrices.get(len(vec))
+            if matrix is None:
+                matrix = matrices[len(vec)] = EmbeddingMatrix(len(vec))
+            matrix.set(row['id'], vec)
+            rows[row['id']] = (row['content'], row['metadata'])
+        self._rows = rows
+        self._matrices = matrices
+        return matrices
     
     def search(self, query_embedding: List[float], top_k: int = 10,
               metadata_filter: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Semantische Suche (vereinfachte Cosine Similarity)"""
-        cursor = self.conn.execute("SELECT * FROM vectors")
-        results = []
+        # Matrizen und Zeilen als zusammengehöriger Stand; gerechnet wird ohne Lock
+        with self._lock:
+            matrices = self._matrices if self._matrices is not None else self._load_matrices()
+            rows = self._rows
+        
+        # Nur Vektoren passender Dimension sind vergleichbar
+        matrix = matrices.get(len(query_embedding))
+        if matrix is None:
+            return []
+        similarities = matrix.similarities(query_embedding).tolist()
+        
+        # Metadaten nur parsen, wo gefiltert oder zurückgegeben wird
+        candidates = []
+        for row, chunk_id in enumerate(matrix.chunk_ids):
+            if metadata_filter:
+                try:
+                    metadata = json.loads(rows[chunk_id][1])
+                except ValueError:
+                    continue
+                if not all(metadata.get(k) == v for k, v in metadata_filter.items()):
+                    continue
+            candidates.append((similarities[row], chunk_id))
         
-        query_vec = np.array(query_embedding)
-        query_norm = np.linalg.norm(query_vec)
+        # Sortiere nach Similarity
+        candidates.sort(key=lambda x: x[0], reverse=True)
         
-        for row in cursor.fetchall():
+        results = []
+        for similarity, chunk_id in candidates:
+            content, metadata_json = rows[chunk_id]
             try:
-                doc_embedding = json.loads(row['embedding'])
-                doc_vec = np.array(doc_embedding)
-                
-                # Cosine Similarity
-                similarity = np.dot(query_vec, doc_vec) / (query_norm * np.linalg.norm(doc_vec))
-                
-                metadata = json.loads(row['metadata'])
-                
-                # Filter nach Metadata
-                if metadata_filter:
-                    if not all(metadata.get(k) == v for k, v in metadata_filter.items()):
-                        continue
-                
-                results.append({
-                    'id': row['id'],
-                    'content': row['content'],
-                    'similarity': float(similarity),
-                    'metadata': metadata
-                })
-            except (json.JSONDecodeError, ValueError):
+                metadata = json.loads(metadata_json)
+            except ValueError:
                 continue
-        
-        # Sortiere nach Similarity
-        results.sort(key=lambda x: x['similarity'], reverse=True)
+            results.append({
+                'id': chunk_id,
+                'content': content,
+                'similarity': similarity,
+                'metadata': metadata
+            })
+            if len(results) == top_k:
+                break
         return results[:top_k]
 
 
@@ -221,11 +315,14 @@ class LexicalSearch:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.conn = None
+        # Eine Verbindung für alle Threads; Zugriffe laufen unter diesem Lock
+        self._lock = threading.Lock()
         self._init_database()
     
     def _init_database(self):
         """Initialisiere Lexical Search (SQLite FTS)"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Queries laufen im Thread-Pool des Servers, nicht im erzeugenden Thread
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         
         self.conn.execute("""
@@ -238,24 +335,26 @@ class LexicalSearch:
     def index_document(self, doc_id: str, content: str, 
                       metadata: Dict[str, Any] = None):
         """Indexiere Dokument für FTS"""
-        self.conn.execute("""
-        INSERT OR REPLACE INTO documents_fts (id, content, metadata)
-        VALUES (?, ?, ?)
-        """, (doc_id, content, json.dumps(metadata or {})))
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute("""
+            INSERT OR REPLACE INTO documents_fts (id, content, metadata)
+            VALUES (?, ?, ?)
+            """, (doc_id, content, json.dumps(metadata or {})))
+            self.conn.commit()
     
     def search(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
         """Full-Text Search"""
-        cursor = self.conn.execute("""
-        SELECT id, content, metadata, rank 
-        FROM documents_fts 
-        WHERE documents_fts MATCH ? 
-        ORDER BY rank 
-        LIMIT ?
-        """, (query, top_k))
+        with self._lock:
+            rows = self.conn.execute("""
+            SELECT id, content, metadata, rank 
+            FROM documents_fts 
+            WHERE documents_fts MATCH ? 
+            ORDER BY rank 
+            LIMIT ?
+            """, (query, top_k)).fetchall()
         
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             try:
                 metadata = json.loads(row['metadata'])
                 results.append({
@@ -448,6 +547,14 @@ class SkillLevelAdaptiveRetriever:
         return final_results[:params.get('max_results', 10)]
 
 
+# PRAGMAs für lesende Query-Last: 256 MiB mmap, 64 MiB Page-Cache
+_READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
 class AKISRetrievalEngine:
     """Hauptklasse für AKIS Retrieval"""
     
@@ -465,6 +572,21 @@ class AKISRetrievalEngine:
         
         logger.info(f"AKIS Retrieval Engine initialized with data_dir: {data_dir}")
     
+    def prime(self) -> None:
+        """Bereite die Verbindungen auf wiederholte Queries vor
+        
+        Setzt Lese-PRAGMAs und liest die durchsuchten Tabellen einmal,
+        damit die Seiten vor der ersten Query im Cache bzw. mmap liegen.
+        """
+        for store, table in ((self.graph, "relations"),
+                             (self.vector_store, "vectors"),
+                             (self.lexical_search, "documents_fts")):
+            with store._lock:
+                for pragma in _READ_PRAGMAS:
+                    store.conn.execute(pragma)
+                for _ in store.conn.execute(f"SELECT * FROM {table}"):
+                    pass
+    
     def query(self, query: str, context: RetrievalContext = None) -> Dict[str, Any]:
         """Haupteingangspunkt für Knowledge Retrieval"""
         if context is None:
@@ -5,15 +5,38 @@ Erweitert das bestehende dashboard.html um Specialized Coding Agent Controls
 """
 
 import asyncio
+import dataclasses
 import json
 import aiohttp
 from aiohttp import web
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj):
+    """Fallback für stdlib json: Dataclasses und datetime wie bei orjson, sonst str"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    """JSON-Antwort; nutzt orjson (Dataclasses/datetime nativ), sonst stdlib json"""
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_SERIALIZE_DATACLASS, default=str)
+        return web.Response(body=body, status=status, content_type="application/json")
+    return web.json_response(data, status=status, dumps=lambda obj: json.dumps(obj, default=_json_default))
+
+
 class SpecializedCodingDashboard:
     """Dashboard Extension für spezialisierte Coding-Agenten"""
     
@@ -47,13 +70,13 @@ class SpecializedCodingDashboard:
         """API: Liste aller aktiven Agenten"""
         try:
             agents = await self.agent_manager.list_active_agents()
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "agents": agents,
                 "count": len(agents)
             })
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)
@@ -67,14 +90,14 @@ class SpecializedCodingDashboard:
             priority = data.get('priority', 1)
             
             if not task:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": "Task description required"
                 }, status=400)
             
             session_id = await self.agent_manager.create_agent(mode, task, priority)
             
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "session_id": session_id,
                 "mode": mode,
@@ -82,7 +105,7 @@ class SpecializedCodingDashboard:
             })
             
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)
@@ -94,18 +117,18 @@ class SpecializedCodingDashboard:
             status = await self.agent_manager.get_agent_status(session_id)
             
             if "error" in status:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": status["error"]
                 }, status=404)
             
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "status": status
             })
             
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)
@@ -118,7 +141,7 @@ class SpecializedCodingDashboard:
             additional_request = data.get('request', '')
             
             if not additional_request:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": "Additional request required"
                 }, status=400)
@@ -127,13 +150,13 @@ class SpecializedCodingDashboard:
                 session_id, additional_request
             )
             
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "result": result
             })
             
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)
@@ -144,13 +167,13 @@ class SpecializedCodingDashboard:
             session_id = request.match_info['session_id']
             result = await self.agent_manager.agent_factory.terminate_session(session_id)
             
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "result": result
             })
             
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)
@@ -159,12 +182,12 @@ class SpecializedCodingDashboard:
         """API: Performance Metriken"""
         try:
             metrics = self.agent_manager.get_performance_metrics()
-            return web.json_response({
+            return json_response({
                 "success": True,
                 "metrics": metrics
             })
         except Exception as e:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": str(e)
             }, status=500)